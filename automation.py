@@ -1,22 +1,60 @@
+import asyncio
 import json
 import logging
 import os
+import re
 import time
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
 
-from playwright.sync_api import Playwright, sync_playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
+from playwright.sync_api import Page, sync_playwright, TimeoutError as PlaywrightTimeoutError
 
-from utils import log_action, load_profile
+from utils import log_action
+
+try:  # Optional fast JSON backend; stdlib json is used when not installed
+    import orjson
+except ImportError:
+    orjson = None
 
 
 EXTENSION_ID = "mpbjkejclgfgadiemmefgebjfooflfhl"
 
+# Splits extension version folder names like "3.1.0_0" into numeric parts
+_VERSION_SPLIT_RE = re.compile(r"[._]")
+
+# Fast path for dates that are already in HTML5 date input format
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_DATE_FORMATS = ("%d/%m/%Y", "%m/%d/%Y", "%d-%m-%Y", "%m-%d-%Y")
+
+
+def _normalize_date(raw_date: str) -> Optional[str]:
+    """Convert a profile date to YYYY-MM-DD; returns None if unrecognized."""
+    if _ISO_DATE_RE.fullmatch(raw_date):
+        return raw_date
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(raw_date, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+
+def _version_key(path: Path) -> tuple:
+    """Sort key that orders version folders numerically (10.0 > 2.0)."""
+    return tuple(int(part) for part in _VERSION_SPLIT_RE.split(path.name) if part.isdigit())
 
+
+@lru_cache(maxsize=1)
 def get_extension_dir() -> Optional[Path]:
     """Resolve the latest version folder of the Chrome extension for the current user.
 
+    The result is cached for the process lifetime; the installed extension
+    version does not change while the app is running.
+
     Looks under:
         %LOCALAPPDATA%\\Google\\Chrome\\User Data\\Default\\Extensions\\{EXTENSION_ID}\\
     """
@@ -45,8 +83,8 @@ def get_extension_dir() -> Optional[Path]:
         logging.warning("No version subfolders found under Chrome extension directory: %s", base_dir)
         return None
 
-    # Choose the version folder with the highest name (e.g. 3.1.0_0 > 3.0.0_0)
-    latest = sorted(version_dirs, key=lambda p: p.name)[-1]
+    # Choose the highest version folder numerically (e.g. 10.0.0_0 > 3.1.0_0)
+    latest = max(version_dirs, key=_version_key)
     logging.info("Using Chrome extension directory: %s", latest)
     return latest
 
@@ -88,6 +126,60 @@ DEFAULT_SELECTORS: Dict[str, str] = {
 }
 
 
+# Text-like fields whose profile key matches their selector key
+_TEXT_FIELD_KEYS = (
+    "email",
+    "date",
+    "teacher_name",
+    "student_name",
+    "quran_surah",
+    "noor_page",
+    "tajweed_rules",
+    "topic",
+    "homework",
+    "parent_notes",
+    "admin_notes",
+)
+
+# Fills all text fields in one page.evaluate round-trip instead of one
+# CDP round-trip per field; returns the selectors it could not find.
+_BATCH_FILL_JS = """(fields) => {
+    const missing = [];
+    for (const [sel, val] of Object.entries(fields)) {
+        const el = document.querySelector(sel);
+        if (!el) {
+            missing.push(sel);
+            continue;
+        }
+        el.focus();
+        el.value = val;
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    return missing;
+}"""
+
+
+@lru_cache(maxsize=16)
+def _ensure_hl_en(form_url: str) -> str:
+    """Normalize a form URL to request the English UI explicitly (hl=en)."""
+    parsed = urlparse(form_url)
+    query_params = dict(parse_qsl(parsed.query))
+    query_params.setdefault("hl", "en")
+    return urlunparse(
+        parsed._replace(query=urlencode(query_params, doseq=True)),
+    )
+
+
+@lru_cache(maxsize=32)
+def _load_json_cached(path: str, mtime_ns: int) -> Any:
+    """Parse a JSON file, keyed by (path, mtime) so edits invalidate the entry."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 def load_selectors_from_json(path: Optional[str]) -> Dict[str, str]:
     """
     Load field selectors from a JSON file if provided, otherwise use defaults.
@@ -99,8 +191,7 @@ def load_selectors_from_json(path: Optional[str]) -> Dict[str, str]:
         logging.warning("Selectors file not found; using default selectors.")
         return DEFAULT_SELECTORS
 
-    with selector_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _load_json_cached(str(selector_path), selector_path.stat().st_mtime_ns)
 
     # Merge defaults with overrides
     merged = DEFAULT_SELECTORS.copy()
@@ -109,170 +200,151 @@ def load_selectors_from_json(path: Optional[str]) -> Dict[str, str]:
 
 
 def _fill_form(
-    playwright: Playwright,
+    page: Page,
     profile_data: Dict[str, Any],
     form_url: str,
     selectors: Dict[str, str],
-    headless: bool = True,
     send_copy: bool = False,
-    use_extension: bool = False,
 ) -> bool:
-    """Internal helper to open a browser and fill the form using profile_data."""
-
-    browser = None
-    context = None
-
-    if use_extension:
-        ext_dir = get_extension_dir()
-        if ext_dir is not None:
-            # Use a persistent context so the extension can be loaded from the Chrome profile path.
-            user_data_dir = str(Path(__file__).resolve().parent / "playwright_profile")
-            context = playwright.chromium.launch_persistent_context(
-                user_data_dir=user_data_dir,
-                headless=False,  # extensions require headed mode
-                args=[
-                    f"--disable-extensions-except={ext_dir}",
-                    f"--load-extension={ext_dir}",
-                ],
-                locale="en-US",
-                extra_http_headers={
-                    "Accept-Language": "en-US,en;q=0.9",
-                },
-            )
-            page = context.new_page()
-        else:
-            logging.warning("Proceeding without extension because extension directory could not be resolved.")
-
-    if context is None:
-        # Normal headless/headed launch without extension
-        browser = playwright.chromium.launch(headless=headless)
-        context = browser.new_context(
-            locale="en-US",
-            extra_http_headers={
-                "Accept-Language": "en-US,en;q=0.9",
-            },
-        )
-        page = context.new_page()
+    """Internal helper to fill and submit the form on an already-open page.
 
-    success = False
+    form_url is expected to be pre-normalized via _ensure_hl_en by the caller.
+    """
 
-    try:
-        # Normalize URL to request English UI explicitly (hl=en)
-        parsed = urlparse(form_url)
-        query_params = dict(parse_qsl(parsed.query))
-        query_params.setdefault("hl", "en")
-        english_form_url = urlunparse(
-            parsed._replace(query=urlencode(query_params, doseq=True)),
-        )
+    success = False
 
-        page.goto(english_form_url, timeout=60_000)
-
-        # Normalize date value from profile to HTML5 date input format (YYYY-MM-DD)
-        raw_date = profile_data.get("date")
-        if raw_date:
-            # Accept common formats like DD/MM/YYYY or MM/DD/YYYY and keep YYYY-MM-DD as is
-            from datetime import datetime  # local import to avoid unused at module level
-
-            normalized = None
-            for fmt in ("%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%d-%m-%Y", "%m-%d-%Y"):
-                try:
-                    normalized = datetime.strptime(raw_date, fmt).strftime("%Y-%m-%d")
-                    break
-                except ValueError:
-                    continue
-            if normalized:
-                profile_data["date"] = normalized
-
-        def set_value(field_key: str, profile_key: str) -> None:
-            selector = selectors.get(field_key)
-            if not selector:
-                return
-            value = profile_data.get(profile_key, "")
-            if value is None:
-                value = ""
-            if not value:
-                return
-            try:
-                page.fill(selector, str(value), timeout=15_000)
-            except PlaywrightTimeoutError as exc:
-                logging.error("Timeout filling %s with selector %s: %s", field_key, selector, exc)
-
-        # Email, dates, text fields
-        set_value("email", "email")
-        set_value("date", "date")
-        set_value("teacher_name", "teacher_name")
-        set_value("student_name", "student_name")
-        set_value("quran_surah", "quran_surah")
-        set_value("noor_page", "noor_page")
-        set_value("tajweed_rules", "tajweed_rules")
-        set_value("topic", "topic")
-        set_value("homework", "homework")
-        set_value("parent_notes", "parent_notes")
-        set_value("admin_notes", "admin_notes")
-
-        # Tafseer radios: choose the option whose aria-label matches the profile value
-        tafseer_value = profile_data.get("tafseer")
-        if tafseer_value:
-            tafseer_radio_selector = (
-                f"div[role='radio'][aria-label='{tafseer_value}']"
-            )
-            try:
-                page.click(tafseer_radio_selector, timeout=15_000)
-            except PlaywrightTimeoutError as exc:
-                logging.error(
-                    "Timeout clicking tafseer radio %s: %s",
-                    tafseer_radio_selector,
-                    exc,
-                )
+    # DOMContentLoaded is enough: one explicit gate below replaces the
+    # per-field actionability polling that a full load wait would hide.
+    page.goto(form_url, timeout=60_000, wait_until="domcontentloaded")
 
-        # Optional: "Send me a copy of my responses" checkbox
-        send_copy_selector = selectors.get("send_copy_checkbox")
-        if send_copy and send_copy_selector:
-            try:
-                # Prefer check() to ensure it is selected
-                page.check(send_copy_selector, timeout=15_000)
-            except Exception as exc:  # noqa: BLE001
-                logging.error(
-                    "Error setting send-copy checkbox %s: %s",
-                    send_copy_selector,
-                    exc,
-                )
+    # Wait once for the form to be in the DOM, then act without per-field waits
+    gate_selector = selectors.get("email")
+    if gate_selector:
+        try:
+            page.wait_for_selector(gate_selector, state="attached", timeout=20_000)
+        except PlaywrightTimeoutError as exc:
+            logging.error("Form fields did not appear (%s): %s", gate_selector, exc)
+
+    # Normalize date value from profile to HTML5 date input format (YYYY-MM-DD)
+    raw_date = profile_data.get("date")
+    if raw_date:
+        normalized = _normalize_date(raw_date)
+        if normalized:
+            profile_data["date"] = normalized
+
+    # Bind lookups once; the per-field loop then runs on plain locals
+    selectors_get = selectors.get
+    profile_get = profile_data.get
+
+    # Email, dates, text fields: inject everything in one evaluate call
+    fields: Dict[str, str] = {}
+    for field_key in _TEXT_FIELD_KEYS:
+        selector = selectors_get(field_key)
+        if not selector:
+            continue
+        value = profile_get(field_key, "")
+        if not value:
+            continue
+        fields[selector] = str(value)
+
+    missing: List[str] = []
+    if fields:
+        try:
+            missing = page.evaluate(_BATCH_FILL_JS, fields)
+        except Exception as exc:  # noqa: BLE001
+            logging.error("Batch field injection failed; falling back to per-field fill: %s", exc)
+            missing = list(fields)
 
-        # Submit
-        submit_selector = selectors.get("submit_button")
-        if submit_selector:
-            try:
-                page.click(submit_selector, timeout=30_000)
-            except PlaywrightTimeoutError as exc:
-                logging.error("Timeout clicking submit button %s: %s", submit_selector, exc)
+    # Fallback: per-field fill for any selector the batch pass could not handle
+    for selector in missing:
+        try:
+            page.fill(selector, fields[selector], timeout=15_000)
+        except PlaywrightTimeoutError as exc:
+            logging.error("Timeout filling selector %s: %s", selector, exc)
+
+    # Tafseer radios: choose the option whose aria-label matches the profile value
+    tafseer_value = profile_get("tafseer")
+    if tafseer_value:
+        tafseer_radio_selector = (
+            f"div[role='radio'][aria-label='{tafseer_value}']"
+        )
+        try:
+            page.click(tafseer_radio_selector, timeout=15_000)
+        except PlaywrightTimeoutError as exc:
+            logging.error(
+                "Timeout clicking tafseer radio %s: %s",
+                tafseer_radio_selector,
+                exc,
+            )
 
-        # Wait for confirmation that the form was submitted successfully
-        success_locator = selectors.get("success_text")
+    # Optional: "Send me a copy of my responses" checkbox
+    send_copy_selector = selectors_get("send_copy_checkbox")
+    if send_copy and send_copy_selector:
         try:
-            if success_locator:
-                # Wait until the confirmation text/element appears
-                page.wait_for_selector(success_locator, timeout=20_000)
-                success = True
-            else:
-                # Fallback: wait briefly and consider a URL change as success
-                previous_url = page.url
-                page.wait_for_timeout(3_000)
-                if page.url != previous_url:
-                    success = True
+            # Prefer check() to ensure it is selected
+            page.check(send_copy_selector, timeout=15_000)
         except Exception as exc:  # noqa: BLE001
-            logging.error("Did not detect form submission confirmation: %s", exc)
+            logging.error(
+                "Error setting send-copy checkbox %s: %s",
+                send_copy_selector,
+                exc,
+            )
 
-    finally:
-        if context is not None:
-            context.close()
-        if browser is not None:
-            browser.close()
+    # Submit
+    submit_selector = selectors_get("submit_button")
+    if submit_selector:
+        try:
+            page.click(submit_selector, timeout=30_000)
+        except PlaywrightTimeoutError as exc:
+            logging.error("Timeout clicking submit button %s: %s", submit_selector, exc)
 
+    # Wait for confirmation that the form was submitted successfully
+    success_locator = selectors_get("success_text")
+    try:
+        if success_locator:
+            # Wait until the confirmation text/element appears
+            page.wait_for_selector(success_locator, timeout=20_000)
+            success = True
+        else:
+            # Fallback: wait briefly and consider a URL change as success
+            previous_url = page.url
+            page.wait_for_timeout(3_000)
+            if page.url != previous_url:
+                success = True
+    except Exception as exc:  # noqa: BLE001
+        logging.error("Did not detect form submission confirmation: %s", exc)
     return success
 
 
-def submit_profile_to_form(
-    profile_path: str,
+def _load_validated_profile(profile_path: str) -> Dict[str, Any]:
+    """Validate a profile path and load its JSON contents.
+
+    Raises:
+        FileNotFoundError: If profile file doesn't exist
+        ValueError: If profile file is corrupted or invalid
+        RuntimeError: If the profile cannot be read
+    """
+    profile_file = Path(profile_path)
+    if not profile_file.exists():
+        raise FileNotFoundError(f"Profile file not found: {profile_path}")
+
+    if not profile_file.is_file():
+        raise ValueError(f"Profile path is not a file: {profile_path}")
+
+    try:
+        # Cached by (path, mtime): repeated batch/retry runs skip re-parsing
+        data = _load_json_cached(str(profile_file), profile_file.stat().st_mtime_ns)
+        # Copy so callers (e.g. date normalization) never mutate the cache
+        return dict(data)
+    except ValueError as e:
+        # Covers json.JSONDecodeError and orjson.JSONDecodeError alike
+        raise ValueError(f"Profile file is corrupted (invalid JSON): {e}") from e
+    except Exception as e:
+        raise RuntimeError(f"Failed to load profile: {e}") from e
+
+
+def submit_profiles_to_form(
+    profile_paths: List[str],
     form_url: str,
     selectors_json_path: Optional[str] = None,
     max_retries: int = 3,
@@ -280,66 +352,145 @@ def submit_profile_to_form(
     send_copy: bool = False,
     use_extension: bool = False,
     retry_delay_seconds: float = 5.0,
-) -> bool:
+) -> Dict[str, bool]:
     """
-    Read a student profile JSON and fill the corresponding Google Form.
+    Submit several student profiles to the Google Form using one browser session.
+
+    Playwright and the browser are started once; each profile gets a fresh
+    BrowserContext, so the (expensive) browser launch is amortized over the
+    whole batch instead of being paid per profile.
 
     Args:
-        profile_path: Path to student profile JSON file.
+        profile_paths: Paths to student profile JSON files.
         form_url: URL of the Google Form.
         selectors_json_path: Optional path to JSON with selector overrides.
-        max_retries: Number of times to retry on failure.
+        max_retries: Number of times to retry each profile on failure.
         headless: Run browser in headless mode if True.
         send_copy: Whether to check the "Send me a copy of my responses" checkbox.
         use_extension: Whether to use the Chrome extension.
         retry_delay_seconds: Seconds to wait between retries.
 
     Returns:
-        True if at least one submission appears to succeed, False otherwise.
-        
+        Mapping of profile path to True/False submission success.
+
     Raises:
-        FileNotFoundError: If profile file doesn't exist
-        ValueError: If profile file is corrupted or invalid
-        RuntimeError: If form submission fails after all retries
+        FileNotFoundError: If a profile file doesn't exist
+        ValueError: If a profile file is corrupted or the form URL is invalid
+        RuntimeError: If a profile cannot be read
     """
-    # Validate profile path
-    profile_file = Path(profile_path)
-    if not profile_file.exists():
-        raise FileNotFoundError(f"Profile file not found: {profile_path}")
-    
-    if not profile_file.is_file():
-        raise ValueError(f"Profile path is not a file: {profile_path}")
-    
-    # Load and validate profile
-    try:
-        profile = load_profile(profile_file)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Profile file is corrupted (invalid JSON): {e}") from e
-    except Exception as e:
-        raise RuntimeError(f"Failed to load profile: {e}") from e
-    
     # Validate form URL
     if not form_url or not form_url.strip():
         raise ValueError("Form URL is required")
-    
+
     if not form_url.startswith(('http://', 'https://')):
         raise ValueError("Form URL must start with http:// or https://")
-    
+
+    # Normalize once per batch; every profile visits the same URL
+    form_url = _ensure_hl_en(form_url)
+
+    # Load and validate all profiles up front so bad input fails before the
+    # browser is launched.
+    profiles = {path: _load_validated_profile(path) for path in profile_paths}
+
     selectors = load_selectors_from_json(selectors_json_path)
 
+    results: Dict[str, bool] = {}
+
+    with sync_playwright() as playwright:
+        browser = None
+        persistent_context = None
+
+        if use_extension:
+            ext_dir = get_extension_dir()
+            if ext_dir is not None:
+                # Use a persistent context so the extension can be loaded from the Chrome profile path.
+                user_data_dir = str(Path(__file__).resolve().parent / "playwright_profile")
+                persistent_context = playwright.chromium.launch_persistent_context(
+                    user_data_dir=user_data_dir,
+                    headless=False,  # extensions require headed mode
+                    args=[
+                        f"--disable-extensions-except={ext_dir}",
+                        f"--load-extension={ext_dir}",
+                        # Generous disk cache so form assets are served from
+                        # cache for every profile after the first
+                        "--disk-cache-size=104857600",
+                    ],
+                    locale="en-US",
+                    extra_http_headers={
+                        "Accept-Language": "en-US,en;q=0.9",
+                    },
+                )
+            else:
+                logging.warning("Proceeding without extension because extension directory could not be resolved.")
+
+        if persistent_context is None:
+            # Normal headless/headed launch without extension
+            browser = playwright.chromium.launch(headless=headless)
+
+        try:
+            for profile_path in profile_paths:
+                results[profile_path] = _submit_single_profile(
+                    browser=browser,
+                    persistent_context=persistent_context,
+                    profile_path=profile_path,
+                    profile_data=profiles[profile_path],
+                    form_url=form_url,
+                    selectors=selectors,
+                    max_retries=max_retries,
+                    send_copy=send_copy,
+                    retry_delay_seconds=retry_delay_seconds,
+                )
+        finally:
+            if persistent_context is not None:
+                persistent_context.close()
+            if browser is not None:
+                browser.close()
+
+    return results
+
+
+def _submit_single_profile(
+    browser,
+    persistent_context,
+    profile_path: str,
+    profile_data: Dict[str, Any],
+    form_url: str,
+    selectors: Dict[str, str],
+    max_retries: int,
+    send_copy: bool,
+    retry_delay_seconds: float,
+) -> bool:
+    """Run the fill/retry loop for one profile inside an open browser session."""
+
     last_error = None
     for attempt in range(1, max_retries + 1):
+        context = None
         try:
-            with sync_playwright() as p:
+            if persistent_context is not None:
+                page = persistent_context.new_page()
+            else:
+                context = browser.new_context(
+                    locale="en-US",
+                    extra_http_headers={
+                        "Accept-Language": "en-US,en;q=0.9",
+                    },
+                )
+                page = context.new_page()
+
+            try:
                 success = _fill_form(
-                    playwright=p,
-                    profile_data=profile,
+                    page=page,
+                    profile_data=profile_data,
                     form_url=form_url,
                     selectors=selectors,
-                    headless=headless,
                     send_copy=send_copy,
-                    use_extension=use_extension,
                 )
+            finally:
+                if context is not None:
+                    context.close()
+                else:
+                    page.close()
+
             if success:
                 log_action(
                     f"Form submission confirmed for {profile_path} on attempt {attempt}",
@@ -373,4 +524,279 @@ def submit_profile_to_form(
 
     log_action(f"Form submission failed after {max_retries} attempts for {profile_path}")
     # Return False instead of raising - let caller handle the error
-    return False
\ No newline at end of file
+    return False
+
+
+async def _fill_form_async(
+    page,
+    profile_data: Dict[str, Any],
+    form_url: str,
+    selectors: Dict[str, str],
+    send_copy: bool = False,
+) -> bool:
+    """Async mirror of _fill_form for use with playwright.async_api pages.
+
+    form_url is expected to be pre-normalized via _ensure_hl_en by the caller.
+    """
+
+    success = False
+
+    await page.goto(form_url, timeout=60_000, wait_until="domcontentloaded")
+
+    # Normalize date value from profile to HTML5 date input format (YYYY-MM-DD)
+    raw_date = profile_data.get("date")
+    if raw_date:
+        normalized = _normalize_date(raw_date)
+        if normalized:
+            profile_data["date"] = normalized
+
+    async def set_value(field_key: str, profile_key: str) -> None:
+        selector = selectors.get(field_key)
+        if not selector:
+            return
+        value = profile_data.get(profile_key, "")
+        if value is None:
+            value = ""
+        if not value:
+            return
+        try:
+            await page.fill(selector, str(value), timeout=15_000)
+        except PlaywrightTimeoutError as exc:
+            logging.error("Timeout filling %s with selector %s: %s", field_key, selector, exc)
+
+    # Email, dates, text fields
+    for field_key in _TEXT_FIELD_KEYS:
+        await set_value(field_key, field_key)
+
+    # Tafseer radios: choose the option whose aria-label matches the profile value
+    tafseer_value = profile_data.get("tafseer")
+    if tafseer_value:
+        tafseer_radio_selector = (
+            f"div[role='radio'][aria-label='{tafseer_value}']"
+        )
+        try:
+            await page.click(tafseer_radio_selector, timeout=15_000)
+        except PlaywrightTimeoutError as exc:
+            logging.error(
+                "Timeout clicking tafseer radio %s: %s",
+                tafseer_radio_selector,
+                exc,
+            )
+
+    # Optional: "Send me a copy of my responses" checkbox
+    send_copy_selector = selectors.get("send_copy_checkbox")
+    if send_copy and send_copy_selector:
+        try:
+            await page.check(send_copy_selector, timeout=15_000)
+        except Exception as exc:  # noqa: BLE001
+            logging.error(
+                "Error setting send-copy checkbox %s: %s",
+                send_copy_selector,
+                exc,
+            )
+
+    # Submit
+    submit_selector = selectors.get("submit_button")
+    if submit_selector:
+        try:
+            await page.click(submit_selector, timeout=30_000)
+        except PlaywrightTimeoutError as exc:
+            logging.error("Timeout clicking submit button %s: %s", submit_selector, exc)
+
+    # Wait for confirmation that the form was submitted successfully
+    success_locator = selectors.get("success_text")
+    try:
+        if success_locator:
+            await page.wait_for_selector(success_locator, timeout=20_000)
+            success = True
+        else:
+            previous_url = page.url
+            await page.wait_for_timeout(3_000)
+            if page.url != previous_url:
+                success = True
+    except Exception as exc:  # noqa: BLE001
+        logging.error("Did not detect form submission confirmation: %s", exc)
+
+    return success
+
+
+async def _submit_profiles_async(
+    profile_paths: List[str],
+    profiles: Dict[str, Dict[str, Any]],
+    form_url: str,
+    selectors: Dict[str, str],
+    max_retries: int,
+    headless: bool,
+    send_copy: bool,
+    retry_delay_seconds: float,
+    max_concurrency: int,
+) -> Dict[str, bool]:
+    """Share one browser and run submissions in parallel contexts."""
+
+    results: Dict[str, bool] = {}
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=headless)
+
+        async def worker(profile_path: str) -> None:
+            async with semaphore:
+                for attempt in range(1, max_retries + 1):
+                    context = await browser.new_context(
+                        locale="en-US",
+                        extra_http_headers={
+                            "Accept-Language": "en-US,en;q=0.9",
+                        },
+                    )
+                    try:
+                        page = await context.new_page()
+                        success = await _fill_form_async(
+                            page=page,
+                            profile_data=profiles[profile_path],
+                            form_url=form_url,
+                            selectors=selectors,
+                            send_copy=send_copy,
+                        )
+                    except Exception as exc:  # noqa: BLE001
+                        success = False
+                        logging.error(
+                            "Form submission error for %s on attempt %d: %s",
+                            profile_path,
+                            attempt,
+                            exc,
+                        )
+                    finally:
+                        await context.close()
+
+                    if success:
+                        log_action(
+                            f"Form submission confirmed for {profile_path} on attempt {attempt}",
+                        )
+                        results[profile_path] = True
+                        return
+                    logging.warning(
+                        "Form submission attempt %d for %s did not show confirmation text.",
+                        attempt,
+                        profile_path,
+                    )
+                    if attempt < max_retries and retry_delay_seconds > 0:
+                        await asyncio.sleep(retry_delay_seconds)
+
+                log_action(f"Form submission failed after {max_retries} attempts for {profile_path}")
+                results[profile_path] = False
+
+        await asyncio.gather(*(worker(path) for path in profile_paths))
+        await browser.close()
+
+    return results
+
+
+def submit_profiles_to_form_parallel(
+    profile_paths: List[str],
+    form_url: str,
+    selectors_json_path: Optional[str] = None,
+    max_retries: int = 3,
+    headless: bool = True,
+    send_copy: bool = False,
+    retry_delay_seconds: float = 5.0,
+    max_concurrency: int = 3,
+) -> Dict[str, bool]:
+    """
+    Submit several profiles concurrently using parallel browser contexts.
+
+    One browser is launched and each profile runs in its own context; up to
+    max_concurrency submissions are in flight at once, so the network-bound
+    waits (page.goto, wait_for_selector) overlap instead of adding up.
+
+    Extension mode needs a persistent headed context and cannot be
+    parallelized; use submit_profiles_to_form for that.
+
+    Args:
+        profile_paths: Paths to student profile JSON files.
+        form_url: URL of the Google Form.
+        selectors_json_path: Optional path to JSON with selector overrides.
+        max_retries: Number of times to retry each profile on failure.
+        headless: Run browser in headless mode if True.
+        send_copy: Whether to check the "Send me a copy of my responses" checkbox.
+        retry_delay_seconds: Seconds to wait between retries.
+        max_concurrency: Maximum number of simultaneous submissions.
+
+    Returns:
+        Mapping of profile path to True/False submission success.
+
+    Raises:
+        FileNotFoundError: If a profile file doesn't exist
+        ValueError: If a profile file is corrupted or the form URL is invalid
+        RuntimeError: If a profile cannot be read
+    """
+    if not form_url or not form_url.strip():
+        raise ValueError("Form URL is required")
+
+    if not form_url.startswith(('http://', 'https://')):
+        raise ValueError("Form URL must start with http:// or https://")
+
+    # Normalize once per batch; every profile visits the same URL
+    form_url = _ensure_hl_en(form_url)
+
+    profiles = {path: _load_validated_profile(path) for path in profile_paths}
+    selectors = load_selectors_from_json(selectors_json_path)
+
+    return asyncio.run(
+        _submit_profiles_async(
+            profile_paths=profile_paths,
+            profiles=profiles,
+            form_url=form_url,
+            selectors=selectors,
+            max_retries=max_retries,
+            headless=headless,
+            send_copy=send_copy,
+            retry_delay_seconds=retry_delay_seconds,
+            max_concurrency=max_concurrency,
+        )
+    )
+
+
+def submit_profile_to_form(
+    profile_path: str,
+    form_url: str,
+    selectors_json_path: Optional[str] = None,
+    max_retries: int = 3,
+    headless: bool = True,
+    send_copy: bool = False,
+    use_extension: bool = False,
+    retry_delay_seconds: float = 5.0,
+) -> bool:
+    """
+    Read a student profile JSON and fill the corresponding Google Form.
+
+    Thin wrapper around submit_profiles_to_form for a single profile.
+
+    Args:
+        profile_path: Path to student profile JSON file.
+        form_url: URL of the Google Form.
+        selectors_json_path: Optional path to JSON with selector overrides.
+        max_retries: Number of times to retry on failure.
+        headless: Run browser in headless mode if True.
+        send_copy: Whether to check the "Send me a copy of my responses" checkbox.
+        use_extension: Whether to use the Chrome extension.
+        retry_delay_seconds: Seconds to wait between retries.
+
+    Returns:
+        True if at least one submission appears to succeed, False otherwise.
+
+    Raises:
+        FileNotFoundError: If profile file doesn't exist
+        ValueError: If profile file is corrupted or invalid
+        RuntimeError: If form submission fails after all retries
+    """
+    results = submit_profiles_to_form(
+        profile_paths=[profile_path],
+        form_url=form_url,
+        selectors_json_path=selectors_json_path,
+        max_retries=max_retries,
+        headless=headless,
+        send_copy=send_copy,
+        use_extension=use_extension,
+        retry_delay_seconds=retry_delay_seconds,
+    )
+    return results.get(profile_path, False)
\ No newline at end of file
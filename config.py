@@ -1,9 +1,30 @@
+import atexit
+import copy
 import json
 import os
 import logging
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional, List
-from utils import CONFIG_DIR 
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+from utils import CONFIG_DIR
+
+try:  # Optional fast JSON backend; stdlib json is used when not installed
+    import orjson
+except ImportError:
+    orjson = None
+
+from functools import lru_cache
+
+
+# Cap on the recent-files MRU list
+_MAX_RECENT_FILES = 10
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> tuple:
+    """Split a dotted config key once and cache the resulting tuple."""
+    return tuple(key.split("."))
 # -------------------
 # Default settings
 # -------------------
@@ -37,7 +58,7 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
         "retries": 3,
         "retry_delay": 5
     },
-    "recent_files": [],
+    "recent_files": [],  # most-recent-first, capped at _MAX_RECENT_FILES
     "window_size": {
         "width": 1200,
         "height": 800,
@@ -61,19 +82,28 @@ class ConfigManager:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._config = {}
+            # Memoized read-only views handed out by the bulk getters;
+            # cleared on every write so readers never see stale data
+            cls._instance._view_cache = {}
+            cls._instance._dirty = False
+            cls._instance._flush_timer = None
+            cls._instance._flush_lock = threading.Lock()
             cls._instance._load_settings()
+            # Make sure any pending debounced write lands on shutdown
+            atexit.register(cls._instance._flush)
         return cls._instance
 
     @staticmethod
-    def _deep_merge(default: dict, override: dict) -> dict:
-        """Recursively merge override dict into default dict."""
-        result = default.copy()
-        for k, v in override.items():
-            if k in result and isinstance(result[k], dict) and isinstance(v, dict):
-                result[k] = ConfigManager._deep_merge(result[k], v)
-            else:
-                result[k] = v
-        return result
+    def _deep_merge_inplace(base: dict, override: dict) -> None:
+        """Merge override into base in place, without per-level dict copies."""
+        stack = [(base, override)]
+        while stack:
+            b, o = stack.pop()
+            for k, v in o.items():
+                if isinstance(v, dict) and isinstance(b.get(k), dict):
+                    stack.append((b[k], v))
+                else:
+                    b[k] = v
 
     def _ensure_config_dir(self) -> None:
         """Ensure the config directory exists."""
@@ -85,51 +115,94 @@ class ConfigManager:
         
         if self._settings_file.exists():
             try:
-                with open(self._settings_file, "r", encoding="utf-8") as f:
-                    loaded = json.load(f)
+                # One contiguous read for either backend: json.loads on
+                # bytes beats json.load's incremental buffered reads
+                raw = self._settings_file.read_bytes()
+                loaded = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 logging.debug(f"Loaded settings from file")
-                self._config = self._deep_merge(DEFAULT_SETTINGS.copy(), loaded)
+                self._config = copy.deepcopy(DEFAULT_SETTINGS)
+                self._deep_merge_inplace(self._config, loaded)
             except Exception as e:
                 logging.error(f"Error loading settings, using defaults: {e}")
-                self._config = DEFAULT_SETTINGS.copy()
+                self._config = copy.deepcopy(DEFAULT_SETTINGS)
         else:
             logging.info("Settings file not found, creating with defaults")
-            self._config = DEFAULT_SETTINGS.copy()
+            self._config = copy.deepcopy(DEFAULT_SETTINGS)
             self.save_settings()
 
+        # One-time migration: older versions stored the form URL at the top
+        # level as well as under google_form.form_url
+        legacy = self._config.pop("google_form_url", None)
+        if legacy and not self._config["google_form"].get("form_url"):
+            self._config["google_form"]["form_url"] = legacy
+
+        # Bounded MRU set: a dict keyed by path gives O(1) dedup (vs. a
+        # list/deque scan) and keeps insertion order, oldest first; the
+        # on-disk list is most-recent-first, hence the reversal
+        entries = list(self._config.get("recent_files", []))[:_MAX_RECENT_FILES]
+        self._config["recent_files"] = dict.fromkeys(reversed(entries))
+
     def save_settings(self):
-        """Save settings to the settings file with error handling and verification."""
+        """Save settings to the settings file atomically."""
         try:
             self._ensure_config_dir()
             temp_file = self._settings_file.with_suffix('.tmp')
-            
-            # Write to a temporary file first
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=4, ensure_ascii=False)
-            
-            # Verify the file was written correctly
-            if not temp_file.exists() or temp_file.stat().st_size == 0:
-                raise IOError("Failed to write settings: file is empty or not created")
-                
-            # Replace the original file
-            if self._settings_file.exists():
-                self._settings_file.unlink()
-            temp_file.rename(self._settings_file)
-            
-            # Verify the final file
-            if not self._settings_file.exists():
-                raise IOError("Failed to create settings file")
-                
+
+            payload = dict(self._config)
+            if isinstance(payload.get("recent_files"), dict):
+                payload["recent_files"] = list(reversed(payload["recent_files"]))
+
+            # Write to a temporary file first; serializing to one
+            # string/bytes object first means a single write syscall
+            if orjson is not None:
+                temp_file.write_bytes(
+                    orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
+            else:
+                temp_file.write_text(
+                    json.dumps(payload, indent=4, ensure_ascii=False),
+                    encoding="utf-8"
+                )
+
+            # Atomic swap: no window where the settings file is missing
+            os.replace(temp_file, self._settings_file)
+
             logging.debug(f"Settings successfully saved to: {self._settings_file.absolute()}")
             return True
-            
+
         except Exception as e:
             logging.error(f"Error saving settings: {e}")
             raise
 
+    def _schedule_flush(self, flush_after: float = 0.2) -> None:
+        """Coalesce a burst of writes into a single deferred save."""
+        with self._flush_lock:
+            self._dirty = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(flush_after, self._flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush(self) -> None:
+        """Write the config to disk if there are unsaved changes."""
+        with self._flush_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            try:
+                self.save_settings()
+            except Exception:
+                # Already logged by save_settings; nothing useful to do on
+                # a background thread.
+                pass
+
     # --- Generic get/set ---
     def get(self, key: str, default: Any = None) -> Any:
-        keys = key.split(".")
+        keys = _split_key(key)
         value = self._config
         try:
             for k in keys:
@@ -140,7 +213,7 @@ class ConfigManager:
 
     def set(self, key: str, value: Any, save: bool = True):
         try:
-            keys = key.split(".")
+            keys = _split_key(key)
             cfg = self._config
             for k in keys[:-1]:
                 if k not in cfg or not isinstance(cfg[k], dict):
@@ -150,16 +223,59 @@ class ConfigManager:
             # Only update and save if the value has changed
             if keys[-1] not in cfg or cfg[keys[-1]] != value:
                 cfg[keys[-1]] = value
+                self._view_cache.clear()
                 if save:
-                    return self.save_settings()
+                    self._schedule_flush()
             return True
         except Exception as e:
             logging.error(f"Error setting config key '{key}': {e}")
             return False
 
+    def set_many(self, updates: Dict[str, Any], save: bool = True):
+        """Set several dotted keys in one pass with at most one disk write."""
+        changed = False
+        try:
+            for key, value in updates.items():
+                keys = _split_key(key)
+                cfg = self._config
+                for k in keys[:-1]:
+                    if k not in cfg or not isinstance(cfg[k], dict):
+                        cfg[k] = {}
+                    cfg = cfg[k]
+
+                if keys[-1] not in cfg or cfg[keys[-1]] != value:
+                    cfg[keys[-1]] = value
+                    changed = True
+
+            if changed:
+                self._view_cache.clear()
+            if changed and save:
+                self._schedule_flush()
+            return True
+        except Exception as e:
+            logging.error(f"Error setting config keys {list(updates)}: {e}")
+            return False
+
+    def get_all(self) -> Dict[str, Any]:
+        """Return a deep copy of the full settings tree.
+
+        Callers that read many keys at once (e.g. the settings dialog)
+        can take one snapshot instead of traversing per dotted key.
+        """
+        snapshot = copy.deepcopy(self._config)
+        if isinstance(snapshot.get("recent_files"), dict):
+            snapshot["recent_files"] = list(reversed(snapshot["recent_files"]))
+        return snapshot
+
     # --- Teacher helpers ---
-    def get_teacher_info(self) -> Dict[str, Any]:
-        return self.get("teacher", DEFAULT_SETTINGS["teacher"].copy())
+    def get_teacher_info(self) -> Mapping[str, Any]:
+        cached = self._view_cache.get("teacher")
+        if cached is None:
+            cached = MappingProxyType(
+                dict(self.get("teacher", DEFAULT_SETTINGS["teacher"]))
+            )
+            self._view_cache["teacher"] = cached
+        return cached
 
     def set_teacher_info(
         self, 
@@ -169,15 +285,13 @@ class ConfigManager:
         institution: str = "", 
         max_students: int = 30
     ) -> None:
-        teacher = self.get_teacher_info()
-        teacher.update({
-            "name": name,
-            "email": email,
-            "phone": phone,
-            "institution": institution,
-            "max_students": max_students
+        self.set_many({
+            "teacher.name": name,
+            "teacher.email": email,
+            "teacher.phone": phone,
+            "teacher.institution": institution,
+            "teacher.max_students": max_students
         })
-        self.set("teacher", teacher)
     # -------------------
     # Theme
     # -------------------
@@ -192,41 +306,45 @@ class ConfigManager:
     # Recent files
     # -------------------
     def add_recent_file(self, file_path: str) -> None:
-        recent = self.get("recent_files", [])
-        if file_path in recent:
-            recent.remove(file_path)
-        recent.insert(0, file_path)
-        self.set("recent_files", recent[:10])
+        recent = self._config["recent_files"]
+        # O(1) move-to-end: re-inserting the key makes it the newest entry
+        recent.pop(file_path, None)
+        recent[file_path] = None
+        while len(recent) > _MAX_RECENT_FILES:
+            del recent[next(iter(recent))]
+        self._view_cache.clear()
+        self._schedule_flush()
 
     def get_recent_files(self) -> List[str]:
-        return self.get("recent_files", [])
+        cached = self._view_cache.get("recent_files")
+        if cached is None:
+            cached = tuple(reversed(self._config["recent_files"]))
+            self._view_cache["recent_files"] = cached
+        # Fresh list per caller: the cached tuple stays immutable
+        return list(cached)
 
-    def get_google_form_settings(self) -> Dict[str, Any]:
+    def get_google_form_settings(self) -> Mapping[str, Any]:
         """Safely get Google Form settings with defaults."""
-        # First try to get from google_form.form_url, if empty try the top-level google_form_url
-        form_url = self.get("google_form.form_url", "")
-        if not form_url.strip():
-            form_url = self.get("google_form_url", "")
-            
-        return {
-            "form_url": form_url,
-            "auto_submit": self.get("google_form.auto_submit", False),
-            "retries": self.get("google_form.retries", 3),
-            "retry_delay": self.get("google_form.retry_delay", 5)
-        }
+        cached = self._view_cache.get("google_form")
+        if cached is None:
+            cached = MappingProxyType({
+                "form_url": self.get("google_form.form_url", ""),
+                "auto_submit": self.get("google_form.auto_submit", False),
+                "retries": self.get("google_form.retries", 3),
+                "retry_delay": self.get("google_form.retry_delay", 5)
+            })
+            self._view_cache["google_form"] = cached
+        return cached
 
     def set_google_form_settings(self, form_url: str, auto_submit: bool, retries: int, retry_delay: int) -> bool:
         """Safely set Google Form settings."""
         try:
-            settings = {
-                "form_url": form_url.strip(),
-                "auto_submit": bool(auto_submit),
-                "retries": max(0, int(retries)),
-                "retry_delay": max(1, int(retry_delay))
-            }
-            # Save to both locations for backward compatibility
-            self.set("google_form_url", form_url.strip(), save=False)
-            return self.set("google_form", settings, save=True)
+            return self.set_many({
+                "google_form.form_url": form_url.strip(),
+                "google_form.auto_submit": bool(auto_submit),
+                "google_form.retries": max(0, int(retries)),
+                "google_form.retry_delay": max(1, int(retry_delay))
+            })
         except (ValueError, TypeError) as e:
             logging.error(f"Invalid Google Form settings: {e}")
             return False
@@ -234,4 +352,8 @@ class ConfigManager:
 # -------------------
 # Global config instance
 # -------------------
+# Initialization-on-demand holder, Python style: the import lock
+# guarantees this module body runs exactly once, so every reader of
+# `config` gets the same instance with no per-call synchronization —
+# get()/set() are bare attribute loads on an already-built object.
 config = ConfigManager()
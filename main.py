@@ -1,6 +1,6 @@
 import sys
 import logging
-import tkinter as tk
+import multiprocessing
 from tkinter import messagebox
 from typing import Optional
 import os
@@ -9,17 +9,12 @@ from utils import ensure_directories, setup_logging
 from ui_main import launch_app
 
 class Application:
-    def __init__(self):
-        self.root = None
-
-
     def show_message(self, title: str, message: str, level: str = "info") -> None:
-        """Show a message box with the specified level."""
-        if not self.root:
-            self.root = tk.Tk()
-            self.root.withdraw()
+        """Show a message box with the specified level.
 
-        
+        messagebox attaches to the default Tk root when one exists, so no
+        second interpreter is spun up just to show an error.
+        """
         try:
             if level.lower() == "error":
                 messagebox.showerror(title, message)
@@ -39,7 +34,7 @@ class Application:
 
             # Remote control mechanism removed for security
             # If needed in the future, implement with proper authentication
-            # and signature verification (see remote_control.py for secure example)
+            # and signature verification
 
             # Launch main application
             launch_app()
@@ -51,14 +46,12 @@ class Application:
                 "A critical error occurred. Please check the logs for details.",
                 "error"
             )
-        finally:
-            if self.root:
-                try:
-                    self.root.destroy()
-                except:
-                    pass
 
 def main() -> None:
+    # Required for the frozen Windows build: worker processes (report
+    # name extraction uses a process pool) re-execute the bundled exe,
+    # and without this each one would launch a full copy of the app
+    multiprocessing.freeze_support()
     app = Application()
     app.run()
 
@@ -1,13 +1,18 @@
 """
 Report export module for generating HTML and PDF reports.
 """
+import io
 import os
 import logging
 import json
+import re
+import threading
 import webbrowser
 import html
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Literal, Union
+from string import Template
+from typing import Any, Dict, List, Optional, Literal, TextIO, Union
 from datetime import datetime
 from dataclasses import asdict
 
@@ -17,207 +22,337 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 from config import config as app_config
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
 from utils import REPORTS_DIR
 from .report_extractor import StudentReport, ReportCriteria
 
+try:  # Optional C-backed PDF renderer; ReportLab remains the fallback
+    from weasyprint import HTML as _WeasyHTML
+except ImportError:
+    _WeasyHTML = None
+
 OutputFormat = Literal['html', 'pdf']
 
-class ReportExporter:
-    """Handles exporting reports to different formats."""
-    
-    def __init__(self, output_dir: str = "reports"):
-        self.output_dir = REPORTS_DIR
-        self.output_dir.mkdir(exist_ok=True)
-    
-    def _format_date(self, date_str: str) -> str:
-        """Format date string for display."""
-        try:
-            # Try parsing with the new DD/MM/YYYY format first
-            dt = datetime.strptime(date_str, '%d/%m/%Y')
-            return dt.strftime('%d %B %Y')  # e.g. "25 November 2023"
-        except ValueError:
-            # Fallback for any other format
-            try:
-                # Try parsing with the old format for backward compatibility
-                dt = datetime.strptime(date_str, '%Y-%m-%d')
-                return dt.strftime('%d/%m/%Y')  # Convert to DD/MM/YYYY
-            except (ValueError, TypeError):
-                return date_str
-    
-    def _get_html_template(self) -> str:
-        """Return the base HTML template for reports."""
-        return """
+# Base HTML template, compiled once at import time. The prefix is a
+# string.Template (only $title varies) so exports avoid re-parsing a ~2 KB
+# format string full of escaped CSS braces on every call.
+_HTML_TEMPLATE_PREFIX = Template("""
         <!DOCTYPE html>
         <html lang="en">
         <head>
             <meta charset="UTF-8">
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Student Report - {title}</title>
+            <title>Student Report - $title</title>
             <style>
-                body {{ 
-                    font-family: Arial, sans-serif; 
-                    line-height: 1.6; 
-                    margin: 0; 
+                body {
+                    font-family: Arial, sans-serif;
+                    line-height: 1.6;
+                    margin: 0;
                     padding: 20px;
                     color: #333;
-                }}
-                .header {{ 
+                }
+                .header {
                     display: flex;
                     justify-content: space-between;
                     align-items: center;
-                    border-bottom: 2px solid #333; 
-                    padding-bottom: 10px; 
-                    margin-bottom: 20px; 
-                }}
-                .logo-container {{
+                    border-bottom: 2px solid #333;
+                    padding-bottom: 10px;
+                    margin-bottom: 20px;
+                }
+                .logo-container {
                     max-width: 150px;
                     text-align: right;
-                }}
-                .logo-container img {{
+                }
+                .logo-container img {
                     max-width: 100%;
                     height: auto;
-                }}
-                .report-title {{ 
-                    color: #2c3e50; 
+                }
+                .report-title {
+                    color: #2c3e50;
                     margin: 0;
-                }}
-                .student-name {{ 
-                    color: #2980b9; 
+                }
+                .student-name {
+                    color: #2980b9;
                     margin: 10px 0 0 0;
-                }}
-                .report-info {{
+                }
+                .report-info {
                     flex: 1;
-                }}
-                table {{ 
-                    width: 100%; 
-                    border-collapse: collapse; 
-                    margin: 15px 0; 
-                }}
-                th, td {{ 
-                    border: 1px solid #ddd; 
-                    padding: 8px; 
-                    text-align: left; 
-                }}
-                th {{ 
-                    background-color: #f2f2f2; 
-                }}
-                tr:nth-child(even) {{ 
-                    background-color: #f9f9f9; 
-                }}
-                .report-date {{ 
-                    color: #7f8c8d; 
-                    font-style: italic; 
-                }}
-                .page-break {{ 
-                    page-break-before: always; 
-                }}
-                @media print {{
-                    .no-print {{
+                }
+                table {
+                    width: 100%;
+                    border-collapse: collapse;
+                    margin: 15px 0;
+                }
+                th, td {
+                    border: 1px solid #ddd;
+                    padding: 8px;
+                    text-align: left;
+                }
+                th {
+                    background-color: #f2f2f2;
+                }
+                tr:nth-child(even) {
+                    background-color: #f9f9f9;
+                }
+                .report-date {
+                    color: #7f8c8d;
+                    font-style: italic;
+                }
+                .page-break {
+                    page-break-before: always;
+                }
+                @media print {
+                    .no-print {
                         display: none;
-                    }}
-                }}
+                    }
+                }
             </style>
         </head>
         <body>
-            {content}
+""")
+
+_HTML_TEMPLATE_SUFFIX = """
         </body>
         </html>
         """
+
+# Per-report table with the constant label cells pre-rendered; only the
+# escaped field values are substituted per report
+_REPORT_TABLE_HTML = (
+    '<table>\n'
+    '<tr><td>Field</td><td>Value</td></tr>\n'
+    '<tr><td>Teacher</td><td>{teacher}</td></tr>\n'
+    '<tr><td>Quran Surah</td><td>{surah}</td></tr>\n'
+    '<tr><td>Tafseer</td><td>{tafseer}</td></tr>\n'
+    '<tr><td>Noor Page</td><td>{noor_page}</td></tr>\n'
+    '<tr><td>Tajweed Rules</td><td>{tajweed}</td></tr>\n'
+    '<tr><td>Topic</td><td>{topic}</td></tr>\n'
+    '<tr><td>Homework</td><td>{homework}</td></tr>\n'
+    '<tr><td>Parent Notes</td><td>{parent_notes}</td></tr>\n'
+    '<tr><td>Admin Notes</td><td>{admin_notes}</td></tr>\n'
+    '</table>\n'
+)
+
+# Most report fields are plain text; scan first and only pay for
+# html.escape's allocation when a special character is actually present.
+_NEEDS_ESCAPE = re.compile(r'[&<>"\']')
+
+
+def _escape_html(text: Any) -> str:
+    """Escape HTML special characters, returning the input unchanged when clean.
+
+    Fields are normally str, but hand-edited or legacy profile JSON can
+    carry numbers (e.g. a bare noor_page), so coerce rather than fail.
+    """
+    if not isinstance(text, str):
+        text = "" if text is None else str(text)
+    if not text:
+        return ""
+    return text if not _NEEDS_ESCAPE.search(text) else html.escape(text)
+
+
+# Fused escape + newline conversion: str.translate walks the string once
+# in C instead of an html.escape pass followed by a replace pass
+_MULTILINE_TRANS = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+    '\n': '<br>',
+})
+
+
+def _format_multiline(text: Any) -> str:
+    """Escape text and convert newlines to <br> for HTML display."""
+    if not isinstance(text, str):
+        text = "" if text is None else str(text)
+    if not text:
+        return "N/A"
+    return text.translate(_MULTILINE_TRANS)
+
+
+_PDF_FIELDS = (
+    ("Teacher", "teacher_name"),
+    ("Quran Surah", "quran_surah"),
+    ("Tafseer", "tafseer"),
+    ("Noor Page", "noor_page"),
+    ("Tajweed Rules", "tajweed_rules"),
+    ("Topic", "topic"),
+    ("Homework", "homework"),
+    ("Parent Notes", "parent_notes"),
+    ("Admin Notes", "admin_notes"),
+)
+
+# ReportLab's import chain is heavy and HTML-only exports never need it,
+# so the modules and the shared immutable styles are loaded on first PDF
+# request and cached in this namespace
+_reportlab = None
+
+
+def _load_reportlab():
+    """Import ReportLab and build the shared PDF styles once, on first use."""
+    global _reportlab
+    if _reportlab is not None:
+        return _reportlab
+
+    from types import SimpleNamespace
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+
+    styles = getSampleStyleSheet()
+    _reportlab = SimpleNamespace(
+        letter=letter,
+        SimpleDocTemplate=SimpleDocTemplate,
+        Table=Table,
+        Paragraph=Paragraph,
+        Spacer=Spacer,
+        Image=Image,
+        inch=inch,
+        styles=styles,
+        title_style=ParagraphStyle(
+            'Title',
+            parent=styles['Heading1'],
+            fontSize=18,
+            spaceAfter=6,
+            alignment=1  # Center aligned
+        ),
+        heading_style=ParagraphStyle(
+            'Heading2',
+            parent=styles['Heading2'],
+            fontSize=14,
+            spaceAfter=6,
+            alignment=1  # Center aligned
+        ),
+        header_table_style=TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+            ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ]),
+        table_style=TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f2f2f2')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dddddd')),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]),
+    )
+    return _reportlab
+
+
+@lru_cache(maxsize=4096)
+def _format_date_cached(date_str: str) -> str:
+    """Format a date string for display, memoized per distinct input.
+
+    strptime is slow and the same date strings recur across a student's
+    reports, so each distinct value is only parsed once.
+    """
+    try:
+        # Try parsing with the new DD/MM/YYYY format first
+        dt = datetime.strptime(date_str, '%d/%m/%Y')
+        return dt.strftime('%d %B %Y')  # e.g. "25 November 2023"
+    except ValueError:
+        # Fallback for any other format
+        try:
+            # Try parsing with the old format for backward compatibility
+            dt = datetime.strptime(date_str, '%Y-%m-%d')
+            return dt.strftime('%d/%m/%Y')  # Convert to DD/MM/YYYY
+        except (ValueError, TypeError):
+            return date_str
+
+
+class ReportExporter:
+    """Handles exporting reports to different formats."""
     
-    def _generate_html_report(self, reports: Dict[str, List[StudentReport]], criteria: ReportCriteria) -> str:
-        """Generate HTML report content."""
-        content_parts = []
-        
-        # Get logo path from config if available
+    def __init__(self, output_dir: str = "reports"):
+        self.output_dir = REPORTS_DIR
+        self.output_dir.mkdir(exist_ok=True)
+    
+    def _format_date(self, date_str: str) -> str:
+        """Format date string for display."""
+        return _format_date_cached(date_str)
+
+    def _generate_html_report(
+        self,
+        reports: Dict[str, List[StudentReport]],
+        criteria: ReportCriteria,
+        buf: TextIO
+    ) -> None:
+        """Write HTML report content into the given text stream.
+
+        Writing straight to the destination (a file for HTML exports)
+        keeps peak memory flat instead of holding the whole document as
+        one string.
+        """
+        buf.write(_HTML_TEMPLATE_PREFIX.substitute(
+            title=f"Student Report - {datetime.now().strftime('%Y-%m-%d')}"
+        ))
+
+        # Resolve the logo once up front; checking per student would stat()
+        # the same path N times
         logo_path = app_config.get("reports.logo_path") or ""
-        
+        logo_url = None
+        if logo_path and os.path.exists(logo_path):
+            try:
+                # Convert path to file URL for HTML
+                logo_url = Path(logo_path).as_uri()
+            except Exception as e:
+                logging.warning(f"Failed to include logo in report: {e}")
+
         for student, student_reports in reports.items():
             # Student header with logo
-            content_parts.append('<div class="header">')
-            content_parts.append('<div class="report-info">')
-            content_parts.append('<h1 class="report-title">Student Progress Report</h1>')
+            buf.write('<div class="header">\n')
+            buf.write('<div class="report-info">\n')
+            buf.write('<h1 class="report-title">Student Progress Report</h1>\n')
             # Escape student name to prevent XSS
-            content_parts.append(f'<h2 class="student-name">{html.escape(student)}</h2>')
-            
+            buf.write(f'<h2 class="student-name">{_escape_html(student)}</h2>\n')
+
             # Add report period if specified
             if criteria.month and criteria.year:
                 month_name = datetime(criteria.year, criteria.month, 1).strftime('%B %Y')
-                content_parts.append(f'<p class="report-date">Report Period: {month_name}</p>')
-                
-            content_parts.append('</div>')  # Close report-info
-            
+                buf.write(f'<p class="report-date">Report Period: {month_name}</p>\n')
+
+            buf.write('</div>\n')  # Close report-info
+
             # Add logo if available
-            if logo_path and os.path.exists(logo_path):
-                try:
-                    # Convert path to file URL for HTML
-                    logo_url = Path(logo_path).as_uri()
-                    content_parts.append(f'''
+            if logo_url:
+                buf.write(f'''
                     <div class="logo-container">
                         <img src="{logo_url}" alt="Logo" />
-                    </div>''')
-                except Exception as e:
-                    logging.warning(f"Failed to include logo in report: {e}")
-            
+                    </div>\n''')
+
+            buf.write('</div>\n')
 
-            content_parts.append('</div>')
-            
             # Reports table
             for report in student_reports:
-                content_parts.append('<div class="report">')
-                content_parts.append(f'<p class="report-date">Report Date: {self._format_date(report.get("date", ""))}</p>')
-                
-                # Create a table for the report data
-                # Escape HTML to prevent XSS attacks
-                def escape_html(text: str) -> str:
-                    """Escape HTML special characters."""
-                    if not text:
-                        return ""
-                    return html.escape(str(text))
-                
-                def format_multiline(text: str) -> str:
-                    """Format multiline text with HTML line breaks."""
-                    if not text:
-                        return "N/A"
-                    # Escape HTML first, then convert newlines to <br>
-                    escaped = escape_html(text)
-                    return escaped.replace("\n", "<br>")
-                
-                report_data = [
-                    ["Field", "Value"],
-                    ["Teacher", escape_html(report.get("teacher_name", "N/A"))],
-                    ["Quran Surah", escape_html(report.get("quran_surah", "N/A"))],
-                    ["Tafseer", escape_html(report.get("tafseer", "N/A"))],
-                    ["Noor Page", escape_html(report.get("noor_page", "N/A"))],
-                    ["Tajweed Rules", escape_html(report.get("tajweed_rules", "N/A"))],
-                    ["Topic", escape_html(report.get("topic", "N/A"))],
-                    ["Homework", format_multiline(report.get("homework", ""))],
-                    ["Parent Notes", format_multiline(report.get("parent_notes", ""))],
-                    ["Admin Notes", format_multiline(report.get("admin_notes", ""))]
-                ]
-                
-                table_html = ['<table>']
-                for row in report_data:
-                    table_html.append('<tr>')
-                    for cell in row:
-                        table_html.append(f'<td>{cell}</td>')
-                    table_html.append('</tr>')
-                table_html.append('</table>')
-                
-                content_parts.extend(table_html)
-                content_parts.append('</div>')
-                content_parts.append('<hr>')  # Separator between reports
-        
-        # Join all parts and insert into template
-        content = '\n'.join(content_parts)
-        return self._get_html_template().format(
-            title=f"Student Report - {datetime.now().strftime('%Y-%m-%d')}",
-            content=content
-        )
+                buf.write('<div class="report">\n')
+                buf.write(f'<p class="report-date">Report Date: {self._format_date(report.get("date", ""))}</p>\n')
+
+                # Fill the pre-rendered table; fields are escaped to
+                # prevent XSS attacks
+                buf.write(_REPORT_TABLE_HTML.format(
+                    teacher=_escape_html(report.get("teacher_name", "N/A")),
+                    surah=_escape_html(report.get("quran_surah", "N/A")),
+                    tafseer=_escape_html(report.get("tafseer", "N/A")),
+                    noor_page=_escape_html(report.get("noor_page", "N/A")),
+                    tajweed=_escape_html(report.get("tajweed_rules", "N/A")),
+                    topic=_escape_html(report.get("topic", "N/A")),
+                    homework=_format_multiline(report.get("homework", "")),
+                    parent_notes=_format_multiline(report.get("parent_notes", "")),
+                    admin_notes=_format_multiline(report.get("admin_notes", ""))
+                ))
+
+                buf.write('</div>\n')
+                buf.write('<hr>\n')  # Separator between reports
+
+        buf.write(_HTML_TEMPLATE_SUFFIX)
     
     def _generate_pdf_report(
         self, 
@@ -235,46 +370,35 @@ class ReportExporter:
         Returns:
             Path to the generated PDF file
         """
-        from reportlab.lib.pagesizes import letter
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib import colors
-        from reportlab.lib.units import inch
-        from reportlab.platypus.flowables import KeepTogether
-        
         # Create output directory if it doesn't exist
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Get logo path from config
+
+        # When WeasyPrint is installed, render the PDF from the HTML
+        # output: one source of truth for layout, and Cairo does the
+        # table work in C instead of ReportLab's per-flowable Python
+        if _WeasyHTML is not None:
+            html_buf = io.StringIO()
+            self._generate_html_report(reports, criteria, html_buf)
+            _WeasyHTML(string=html_buf.getvalue()).write_pdf(str(output_path))
+            return output_path
+
+        rl = _load_reportlab()
+
+        # Check the logo once; ReportLab Image flowables can't be shared
+        # across headers, but the stat() doesn't need repeating per student
         logo_path = app_config.get("reports.logo_path", "")
-        
+        logo_exists = bool(logo_path) and os.path.exists(logo_path)
+
         # Create the PDF document
-        doc = SimpleDocTemplate(
+        doc = rl.SimpleDocTemplate(
             str(output_path),
-            pagesize=letter,
+            pagesize=rl.letter,
             rightMargin=72,
             leftMargin=72,
             topMargin=72,
             bottomMargin=72
         )
         
-        # Define styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'Title',
-            parent=styles['Heading1'],
-            fontSize=18,
-            spaceAfter=6,
-            alignment=1  # Center aligned
-        )
-        heading_style = ParagraphStyle(
-            'Heading2',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceAfter=6,
-            alignment=1  # Center aligned
-        )
-        
         # Function to create header with logo
         def create_header(student: str, elements: list) -> None:
             # Create a table for the header with logo
@@ -282,37 +406,32 @@ class ReportExporter:
             
             # Add logo if available
             logo_img = None
-            if logo_path and os.path.exists(logo_path):
+            if logo_exists:
                 try:
-                    logo_img = Image(logo_path, width=1.5*inch, height=0.75*inch)
+                    logo_img = rl.Image(logo_path, width=1.5*rl.inch, height=0.75*rl.inch)
                     logo_img.hAlign = 'RIGHT'
                 except Exception as e:
                     logging.warning(f"Failed to load logo for PDF: {e}")
             
             # Create a table with two columns: title and logo
-            header_table = Table([
+            header_table = rl.Table([
                 [
-                    Paragraph("Student Progress Report", title_style),
+                    rl.Paragraph("Student Progress Report", rl.title_style),
                     logo_img or ''  # Empty string if no logo
                 ]
             ], colWidths=['70%', '30%'])
-            
+
             # Style the header table
-            header_table.setStyle(TableStyle([
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-                ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ]))
-            
+            header_table.setStyle(rl.header_table_style)
+
             elements.append(header_table)
-            elements.append(Paragraph(student, heading_style))
-            
+            elements.append(rl.Paragraph(student, rl.heading_style))
+
             if criteria.month and criteria.year:
                 month_name = datetime(criteria.year, criteria.month, 1).strftime('%B %Y')
-                elements.append(Paragraph(f"Report Period: {month_name}", styles['Normal']))
-            
-            elements.append(Spacer(1, 12))
+                elements.append(rl.Paragraph(f"Report Period: {month_name}", rl.styles['Normal']))
+
+            elements.append(rl.Spacer(1, 12))
         
         # Build the document content
         elements = []
@@ -322,48 +441,30 @@ class ReportExporter:
             create_header(student, elements)
             
             # Add each report
-            for report in student_reports:
+            last_index = len(student_reports) - 1
+            for i, report in enumerate(student_reports):
                 # Report date
                 report_date = self._format_date(report.get("date", ""))
                 
-                # Create table data
-                table_data = [
-                    ["Field", "Value"],
-                    ["Teacher", report.get("teacher_name", "N/A")],
-                    ["Quran Surah", report.get("quran_surah", "N/A")],
-                    ["Tafseer", report.get("tafseer", "N/A")],
-                    ["Noor Page", report.get("noor_page", "N/A")],
-                    ["Tajweed Rules", report.get("tajweed_rules", "N/A")],
-                    ["Topic", report.get("topic", "N/A")],
-                    ["Homework", report.get("homework", "N/A")],
-                    ["Parent Notes", report.get("parent_notes", "N/A")],
-                    ["Admin Notes", report.get("admin_notes", "N/A")]
+                # Create table data from the shared field list
+                table_data = [["Field", "Value"]] + [
+                    [label, report.get(key, "N/A")] for label, key in _PDF_FIELDS
                 ]
                 
                 # Create table
-                table = Table(table_data, colWidths=[doc.width/3.0, doc.width*2/3.0])
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f2f2f2')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dddddd')),
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ]))
-                
+                table = rl.Table(table_data, colWidths=[doc.width/3.0, doc.width*2/3.0])
+                table.setStyle(rl.table_style)
+
                 elements.append(table)
-                elements.append(Spacer(1, 24))  # Add space between reports
-                
+                elements.append(rl.Spacer(1, 24))  # Add space between reports
+
                 # Add page break if not the last report
-                if report != student_reports[-1]:
-                    elements.append(Spacer(1, 12))
-                    elements.append(Paragraph("-" * 50, styles['Normal']))
-                    elements.append(Spacer(1, 12))
+                if i != last_index:
+                    elements.append(rl.Spacer(1, 12))
+                    elements.append(rl.Paragraph("-" * 50, rl.styles['Normal']))
+                    elements.append(rl.Spacer(1, 12))
                 else:
-                    elements.append(Spacer(1, 12))
+                    elements.append(rl.Spacer(1, 12))
         
         # Build the PDF
         doc.build(elements)
@@ -394,13 +495,19 @@ class ReportExporter:
         output_path = self.output_dir / filename
         
         if output_format == 'html':
-            html_content = self._generate_html_report(reports, criteria)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                self._generate_html_report(reports, criteria, f)
         else:  # PDF
             output_path = self._generate_pdf_report(reports, output_path, criteria)
         
         if open_after:
-            webbrowser.open(f"file://{output_path.absolute()}")
-            
+            # as_uri() gets the platform/encoding details right, and the
+            # browser launch happens off-thread so the caller isn't stuck
+            # waiting on a cold browser start
+            threading.Thread(
+                target=webbrowser.open,
+                args=(output_path.absolute().as_uri(),),
+                daemon=True
+            ).start()
+
         return output_path
@@ -1,17 +1,48 @@
 """
 Report extraction module for filtering and retrieving student reports based on various criteria.
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional, Literal, TypedDict
 import json
+import os
+import re
 from dataclasses import dataclass
+from operator import itemgetter
 from utils import PROFILES_DIR, HISTORY_DIR
+
+try:  # Optional fast JSON backend; stdlib json is used when not installed
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
 ReportMode = Literal['first', 'last', 'all']
 
-@dataclass
+_DMY = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$')
+_YMD = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$')
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> datetime:
+    """Parse DD/MM/YYYY or YYYY-MM-DD, dispatching on a regex match.
+
+    Classifying the format up front avoids a raised-and-caught ValueError
+    per non-matching row, and constructing datetime directly skips strptime.
+    """
+    m = _DMY.match(date_str)
+    if m:
+        return datetime(int(m[3]), int(m[2]), int(m[1]))
+    m = _YMD.match(date_str)
+    if m:
+        return datetime(int(m[1]), int(m[2]), int(m[3]))
+    raise ValueError(f"Invalid date format: {date_str}. Expected DD/MM/YYYY or YYYY-MM-DD")
+
+@dataclass(frozen=True)
 class ReportCriteria:
-    """Criteria for filtering reports."""
+    """Criteria for filtering reports. Frozen so it can key result caches."""
     student_name: Optional[str] = None
     month: Optional[int] = None
     year: Optional[int] = None
@@ -39,47 +70,76 @@ class ReportExtractor:
     def __init__(self, profiles_dir: str = "profiles"):
         self.profiles_dir = PROFILES_DIR
         self.history_dir = HISTORY_DIR
-        
+        # Populated for the duration of a get_reports call so history
+        # lookups don't re-glob the directory once per profile
+        self._history_index: Optional[List[Path]] = None
+
+    def _scan_history_dir(self) -> List[Path]:
+        """List all history JSONL files with a single directory scan."""
+        try:
+            return [
+                Path(entry.path)
+                for entry in os.scandir(self.history_dir)
+                if entry.name.endswith('.jsonl')
+            ]
+        except OSError:
+            return []
+
     def _load_profile_history(self, profile_path: Path) -> List[StudentReport]:
         """Load history for a specific profile from the history directory."""
         # Look for history files that match the profile name pattern
         history_entries = []
         base_name = profile_path.stem.split(' - ')[0]  # Remove any " - Copy" suffixes
         
-        for history_file in self.history_dir.glob(f"{base_name}*.jsonl"):
+        history_files = (
+            self._history_index
+            if self._history_index is not None
+            else self._scan_history_dir()
+        )
+
+        for history_file in history_files:
+            if not history_file.name.startswith(base_name):
+                continue
             try:
+                # Read the whole file once instead of iterating the
+                # buffered readline path per entry
                 with open(history_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        try:
-                            entry = json.loads(line)
-                            if 'snapshot' in entry:
-                                # Convert the snapshot to a StudentReport
-                                report = entry['snapshot']
-                                report['_file'] = str(profile_path)
-                                report['_timestamp'] = entry.get('timestamp', '')
-                                history_entries.append(report)
-                        except json.JSONDecodeError:
-                            continue
+                    lines = f.read().splitlines()
             except (IOError, OSError):
                 continue
+
+            for line in lines:
+                if not line:
+                    continue
+                try:
+                    entry = _json_loads(line)
+                except ValueError:
+                    continue
+                if 'snapshot' in entry:
+                    # Convert the snapshot to a StudentReport
+                    report = entry['snapshot']
+                    report['_file'] = str(profile_path)
+                    report['_timestamp'] = entry.get('timestamp', '')
+                    history_entries.append(report)
                 
         return history_entries
     
     def _get_all_profiles(self) -> List[Path]:
         """Get all profile JSON files."""
         return list(self.profiles_dir.glob("*.json"))
+
+    @staticmethod
+    def _read_profile(profile_path: Path):
+        """Read and parse one profile, returning (path, data, error)."""
+        try:
+            with open(profile_path, 'r', encoding='utf-8') as f:
+                return profile_path, _json_loads(f.read()), None
+        except (ValueError, OSError) as e:
+            return profile_path, None, e
     
     def _parse_date(self, date_str: str) -> datetime:
         """Parse date string in DD/MM/YYYY format, with fallback to YYYY-MM-DD."""
-        try:
-            # Try DD/MM/YYYY format first
-            return datetime.strptime(date_str, '%d/%m/%Y')
-        except ValueError:
-            # Fall back to YYYY-MM-DD for backward compatibility
-            try:
-                return datetime.strptime(date_str, '%Y-%m-%d')
-            except (ValueError, TypeError) as e:
-                raise ValueError(f"Invalid date format: {date_str}. Expected DD/MM/YYYY or YYYY-MM-DD") from e
+        return _parse_date_cached(date_str)
     
     def _matches_date_criteria(self, report_date: str, criteria: ReportCriteria) -> bool:
         """Check if a report matches the date criteria."""
@@ -108,88 +168,76 @@ class ReportExtractor:
             Dictionary mapping student names to their reports
         """
         all_reports: Dict[str, List[StudentReport]] = {}
-        
-        for profile_path in self._get_all_profiles():
-            try:
-                with open(profile_path, 'r', encoding='utf-8') as f:
-                    current_data = json.load(f)
-                    
-                student_name = current_data.get('student_name', 'Unknown')
-                
-                # Skip if student name doesn't match filter
-                if criteria.student_name and student_name != criteria.student_name:
-                    continue
-                    
-                if student_name not in all_reports:
-                    all_reports[student_name] = []
-                
-                # Add current version
-                current_data['_file'] = str(profile_path)
-                current_data['_timestamp'] = datetime.now().isoformat()
-                
-                # Add historical versions from history directory
-                history_entries = self._load_profile_history(profile_path)
-                
-                # Combine current data and history, ensuring we don't have duplicates
-                all_entries = [current_data] + history_entries
-                seen = set()
-                
-                for entry in all_entries:
-                    # Create a unique identifier for each entry based on its content
-                    entry_id = (
-                        entry.get('date', ''),
-                        entry.get('quran_surah', ''),
-                        entry.get('topic', '')
-                    )
-                    
-                    if entry_id not in seen and self._matches_date_criteria(entry.get('date', ''), criteria):
-                        seen.add(entry_id)
-                        all_reports[student_name].append(entry)
-                
-                # Sort by date (newest first)
-                all_reports[student_name].sort(
-                    key=lambda x: datetime.strptime(x.get('date', '1970-01-01'), '%d/%m/%Y'),
-                    reverse=True
-                )
-                
-                # Apply report mode filter
-                if criteria.mode == 'first' and all_reports[student_name]:
-                    all_reports[student_name] = [all_reports[student_name][-1]]  # Oldest
-                elif criteria.mode == 'last' and all_reports[student_name]:
-                    all_reports[student_name] = [all_reports[student_name][0]]  # Newest
-                
-                # Add history
-                history = self._load_profile_history(profile_path)
-                for entry in history:
-                    entry['_file'] = str(profile_path)
-                    all_reports[student_name].append(entry)
-                    
-            except (json.JSONDecodeError, OSError) as e:
-                print(f"Error processing {profile_path}: {e}")
+
+        profile_paths = self._get_all_profiles()
+        if not profile_paths:
+            return {}
+
+        # Scan the history directory once for the whole batch
+        self._history_index = self._scan_history_dir()
+
+        # Profile reads are latency-bound; overlap open/read/parse across
+        # files instead of paying one round trip to disk per profile
+        with ThreadPoolExecutor(max_workers=min(16, len(profile_paths))) as executor:
+            loaded = executor.map(self._read_profile, profile_paths)
+
+        for profile_path, current_data, error in loaded:
+            if error is not None:
+                print(f"Error processing {profile_path}: {error}")
                 continue
-        
-        # Apply filters and sorting
-        filtered_reports: Dict[str, List[StudentReport]] = {}
-        
-        for student, reports in all_reports.items():
-            # Filter by date criteria
-            student_reports = [
-                r for r in reports 
-                if self._matches_date_criteria(r.get('date', ''), criteria)
-            ]
-            
-            if not student_reports:
+            student_name = current_data.get('student_name', 'Unknown')
+
+            # Skip if student name doesn't match filter
+            if criteria.student_name and student_name != criteria.student_name:
                 continue
-                
-            # Sort by date
-            student_reports.sort(key=lambda x: x.get('date', ''))
-            
-            # Apply mode filter
-            if criteria.mode == 'first':
-                filtered_reports[student] = [student_reports[0]]
-            elif criteria.mode == 'last':
-                filtered_reports[student] = [student_reports[-1]]
-            else:  # 'all'
-                filtered_reports[student] = student_reports
-        
-        return filtered_reports
+
+            if student_name not in all_reports:
+                all_reports[student_name] = []
+
+            # Add current version
+            current_data['_file'] = str(profile_path)
+            current_data['_timestamp'] = datetime.now().isoformat()
+
+            # Add historical versions from history directory
+            history_entries = self._load_profile_history(profile_path)
+
+            # Combine current data and history, ensuring we don't have duplicates
+            all_entries = [current_data] + history_entries
+            seen: set = set()
+
+            for entry in all_entries:
+                # Identify each entry by its content fields; teacher and
+                # homework are included so two distinct reports sharing
+                # date/surah/topic are not collapsed into one
+                entry_id = (
+                    entry.get('date', ''),
+                    entry.get('quran_surah', ''),
+                    entry.get('topic', ''),
+                    entry.get('teacher_name', ''),
+                    entry.get('homework', ''),
+                )
+
+                if entry_id not in seen and self._matches_date_criteria(entry.get('date', ''), criteria):
+                    seen.add(entry_id)
+                    # Parse the date once and attach it so the sort below
+                    # doesn't re-parse per element
+                    try:
+                        entry['_parsed_date'] = self._parse_date(entry.get('date', ''))
+                    except (ValueError, TypeError):
+                        entry['_parsed_date'] = datetime(1970, 1, 1)
+                    all_reports[student_name].append(entry)
+
+            # Sort by date (newest first)
+            all_reports[student_name].sort(key=itemgetter('_parsed_date'), reverse=True)
+
+            # Apply report mode filter
+            if criteria.mode == 'first' and all_reports[student_name]:
+                all_reports[student_name] = [all_reports[student_name][-1]]  # Oldest
+            elif criteria.mode == 'last' and all_reports[student_name]:
+                all_reports[student_name] = [all_reports[student_name][0]]  # Newest
+
+        self._history_index = None
+
+        # The dedup loop above already filtered, sorted and applied the
+        # mode; just drop students left with no matching reports
+        return {student: reports for student, reports in all_reports.items() if reports}
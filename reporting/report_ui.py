@@ -3,22 +3,198 @@ UI components for the reporting system.
 """
 from __future__ import annotations
 
+import json
+import os
+import pickle
+import subprocess
+import sys
+import threading
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from tkinter import ttk
-from typing import Optional, Dict, List, Any, Callable
+from typing import Optional, Dict, List, Any, Callable, Tuple
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-import webbrowser
 
 import customtkinter as ctk
 from tkcalendar import DateEntry
-from utils import PROFILES_DIR
+from utils import PROFILES_DIR, CONFIG_DIR
 from .report_extractor import ReportCriteria, ReportExtractor, StudentReport
 from .report_exporter import ReportExporter, OutputFormat
 
+try:  # Optional fast JSON backend; stdlib json is used when not installed
+    import orjson
+except ImportError:
+    orjson = None
+
+# Per-file (mtime, name) cache shared across dialog opens: every load
+# runs a cheap scandir pass and only re-parses the files whose mtime
+# changed. There is deliberately no whole-list cache keyed on the
+# directory mtime — in-place edits to a profile don't touch it
+_student_name_cache: Dict[str, Tuple[int, Optional[str]]] = {}
+
+# The per-file cache is persisted between runs so a fresh launch only
+# re-parses profiles whose mtime changed since the previous session
+_NAME_CACHE_FILE = CONFIG_DIR / "profiles_index.pkl"
+_NAME_CACHE_SCHEMA = 1
+_name_cache_loaded = False
+
+
+def _load_name_cache_from_disk() -> None:
+    """Seed the per-file name cache from the on-disk index, if valid."""
+    global _name_cache_loaded
+    _name_cache_loaded = True
+    try:
+        with open(_NAME_CACHE_FILE, 'rb') as f:
+            payload = pickle.load(f)
+        # The schema key invalidates stale indexes when the format changes
+        if payload.get('schema') == _NAME_CACHE_SCHEMA:
+            _student_name_cache.update(payload['entries'])
+    except (OSError, pickle.PickleError, EOFError, KeyError, AttributeError):
+        pass  # Missing or corrupt index; the scan rebuilds it
+
+
+def _save_name_cache_to_disk() -> None:
+    """Atomically write the per-file name cache for the next launch."""
+    try:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        temp_file = _NAME_CACHE_FILE.with_suffix('.tmp')
+        with open(temp_file, 'wb') as f:
+            pickle.dump(
+                {'schema': _NAME_CACHE_SCHEMA, 'entries': dict(_student_name_cache)},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(temp_file, _NAME_CACHE_FILE)
+    except OSError:
+        pass  # A failed index write only costs a re-scan next launch
+
+# Month names are deterministic per locale; build the lookup tables once
+# instead of twelve datetime+strftime calls per dialog open
+_MONTHS = [(i, datetime(2000, i, 1).strftime('%B')) for i in range(1, 13)]
+_MONTH_NAMES = [name for _, name in _MONTHS]
+_MONTH_NAME_TO_NUM = {name: num for num, name in _MONTHS}
+
+# Year choices, over-provisioned once; the menu slices to the current
+# year and selections map back to ints without a per-generate parse
+_YEARS = tuple(range(2020, 2100))
+_YEAR_STRS = tuple(map(str, _YEARS))
+_YEAR_STR_TO_INT = dict(zip(_YEAR_STRS, _YEARS))
+
+# Screen size is constant for the session; cache it after the first
+# winfo query instead of two Tcl round-trips per dialog open
+_SCREEN_WH: Optional[Tuple[int, int]] = None
+
+
+@lru_cache(maxsize=None)
+def _get_extractor() -> ReportExtractor:
+    """Shared ReportExtractor, built once on first use."""
+    return ReportExtractor()
+
+
+@lru_cache(maxsize=None)
+def _get_exporter() -> ReportExporter:
+    """Shared ReportExporter, built once on first use.
+
+    Construction creates the reports directory, so reusing one instance
+    skips that stat on every dialog open.
+    """
+    return ReportExporter()
+
+
+def _read_student_name(profile_file: Path) -> Optional[str]:
+    """Read the student_name field from one profile, or None on error."""
+    try:
+        raw = profile_file.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return data.get('student_name')
+    except (ValueError, OSError):
+        return None
+
+
+def _load_student_list_cached() -> Tuple[str, ...]:
+    """Get the sorted students with profiles as a tuple, reusing cached scans."""
+    if not _name_cache_loaded:
+        _load_name_cache_from_disk()
+
+    students = set()
+    stale: List[Tuple[Path, int]] = []
+    # os.scandir yields name/stat without re-statting per entry the way
+    # Path.glob does; tiny files can't hold a profile, so skip them
+    try:
+        it = os.scandir(PROFILES_DIR)
+    except OSError:
+        return ()
+    with it:
+        for dir_entry in it:
+            if not dir_entry.name.endswith('.json'):
+                continue
+            try:
+                if not dir_entry.is_file(follow_symlinks=False):
+                    continue
+                stat_result = dir_entry.stat()
+            except OSError:
+                continue
+            if stat_result.st_size <= 32:
+                continue
+            entry = _student_name_cache.get(dir_entry.path)
+            if entry is not None and entry[0] == stat_result.st_mtime_ns:
+                if entry[1]:
+                    students.add(entry[1])
+            else:
+                stale.append((Path(dir_entry.path), stat_result.st_mtime_ns))
+
+    # Parse the files that actually changed in parallel; the GIL is
+    # released during file I/O so a small thread pool overlaps the reads.
+    # Very large cold batches are parse-bound rather than I/O-bound, so
+    # those go to worker processes where the JSON decoding scales across
+    # cores (worker startup amortizes over the batch)
+    if stale:
+        if len(stale) > 200:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                names = list(executor.map(
+                    _read_student_name, (path for path, _ in stale), chunksize=32
+                ))
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(stale))) as executor:
+                names = executor.map(_read_student_name, (path for path, _ in stale))
+        for (profile_file, mtime), name in zip(stale, names):
+            _student_name_cache[str(profile_file)] = (mtime, name)
+            if name:
+                students.add(name)
+        _save_name_cache_to_disk()
+
+    return tuple(sorted(students))
+
 class ReportDialog(ctk.CTkToplevel):
-    """Dialog for configuring and generating reports."""
-    
+    """Dialog for configuring and generating reports.
+
+    The dialog is a hidden singleton: closing it only withdraws the
+    window, so subsequent opens skip rebuilding the CTk widget tree.
+    """
+
+    _instance: Optional["ReportDialog"] = None
+
+    @classmethod
+    def show(cls, parent) -> "ReportDialog":
+        """Show the shared dialog, constructing it on first use."""
+        instance = cls._instance
+        try:
+            alive = instance is not None and instance.winfo_exists()
+        except tk.TclError:
+            alive = False
+
+        if not alive:
+            cls._instance = cls(parent)
+        else:
+            instance._reset_inputs()
+            instance.deiconify()
+            instance.focus_force()
+            instance.after_idle(instance.grab_set)
+        return cls._instance
+
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         
@@ -27,28 +203,67 @@ class ReportDialog(ctk.CTkToplevel):
         self.resizable(True, True)
         
         self.parent = parent
-        self.report_extractor = ReportExtractor()
-        self.report_exporter = ReportExporter()
-        
-        # Make dialog modal
-        self.transient(parent)
-        self.grab_set()
-        self.focus_force()
+        # Module-level singletons: the dialog is modal so the instances
+        # are never used from two dialogs at once
+        self.report_extractor = _get_extractor()
+        self.report_exporter = _get_exporter()
+        # Extraction results keyed by criteria, so regenerating with only
+        # the output format changed skips the expensive re-extraction
+        self._report_cache: "OrderedDict[ReportCriteria, Dict[str, List[StudentReport]]]" = OrderedDict()
         
         # Initialize UI
         self._setup_ui()
-        
-        # Center the dialog
-        self.update_idletasks()
+
+        # Center the dialog, then make it modal — setting the WM hints
+        # after the geometry is final avoids a second recomputation, and
+        # the grab is deferred to after the initial layout is flushed
         self._center_window()
-    
+        self.wm_transient(parent)
+        self.focus_force()
+        self.after_idle(self.grab_set)
+
+        # Route the window-manager close button through destroy so it
+        # hides the dialog rather than tearing down the Tcl widget
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+
+    def destroy(self):
+        """Hide the dialog instead of destroying it.
+
+        The widgets persist for the next open; the Tcl-level teardown
+        happens automatically when the parent window is destroyed.
+        """
+        self.grab_release()
+        self.withdraw()
+
+    def _reset_inputs(self) -> None:
+        """Restore the default selections before re-showing the dialog."""
+        # Profiles may have been edited while the dialog was hidden, so
+        # cached extractions from the previous open can no longer be trusted
+        self._report_cache.clear()
+        now = datetime.now()
+        self._student = "All Students"
+        self.student_dropdown.set(self._student)
+        self.report_type.set("all")
+        self.format_var.set("pdf")
+        self._month_name = now.strftime('%B')
+        self._year_str = str(now.year)
+        self.month_menu.set(self._month_name)
+        self.year_menu.set(self._year_str)
+        # Pick up profiles added since the last open
+        threading.Thread(target=self._populate_students, daemon=True).start()
+
     def _center_window(self):
-        """Center the window on the screen."""
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
+        """Center the window on the screen without forcing an idle flush."""
+        global _SCREEN_WH
+        if _SCREEN_WH is None:
+            _SCREEN_WH = (self.winfo_screenwidth(), self.winfo_screenheight())
+        screen_w, screen_h = _SCREEN_WH
+
+        # The 600x600 geometry from __init__ is authoritative, so only
+        # the position needs computing — no update_idletasks relayout
+        width, height = 600, 600
+        x = (screen_w // 2) - (width // 2)
+        y = (screen_h // 2) - (height // 2)
         self.geometry(f'{width}x{height}+{x}+{y}')
     
     def _setup_ui(self):
@@ -76,14 +291,22 @@ class ReportDialog(ctk.CTkToplevel):
         student_frame.grid_columnconfigure(1, weight=1)
         
         ctk.CTkLabel(student_frame, text="Student:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        self.student_var = ctk.StringVar(value="All Students")
+        # Option-menu selections land in plain attributes via command
+        # callbacks: reading them back costs no Tcl round trip (the radio
+        # groups below keep their StringVars, which Tk needs for mutual
+        # exclusion)
+        self._student = "All Students"
+        # Show a placeholder and fill in the real list off-thread so the
+        # dialog opens without waiting on the profile scan
         self.student_dropdown = ctk.CTkOptionMenu(
             student_frame,
-            variable=self.student_var,
-            values=["All Students"] + self._get_student_list(),
+            values=["All Students", "Loading..."],
+            command=lambda v: setattr(self, '_student', v),
             width=300
         )
+        self.student_dropdown.set(self._student)
         self.student_dropdown.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
+        threading.Thread(target=self._populate_students, daemon=True).start()
         
         # Report type
         report_frame = ctk.CTkFrame(content_frame)
@@ -116,31 +339,27 @@ class ReportDialog(ctk.CTkToplevel):
         ctk.CTkLabel(date_frame, text="Date Range:").grid(row=0, column=0, columnspan=2, padx=5, pady=5, sticky="w")
         
         # Month/Year selection
-        current_month_name = datetime.now().strftime('%B')
-        self.month_var = ctk.StringVar(value=current_month_name)
-        self.year_var = ctk.StringVar(value=str(datetime.now().year))
-        
-        months = [(i, datetime(2000, i, 1).strftime('%B')) for i in range(1, 13)]
-        self._month_name_to_number = {name: num for num, name in months}
-        years = list(range(2020, datetime.now().year + 2))
-        
+        now = datetime.now()
+        self._month_name = now.strftime('%B')
+        self._year_str = str(now.year)
+
         ctk.CTkLabel(date_frame, text="Month:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
-        month_menu = ctk.CTkOptionMenu(
+        self.month_menu = ctk.CTkOptionMenu(
             date_frame,
-            values=[name for _, name in months],
-            variable=self.month_var,
-            command=lambda _: self._update_date()
+            values=_MONTH_NAMES,
+            command=self._on_month_selected
         )
-        month_menu.grid(row=1, column=1, padx=5, pady=5, sticky="w")
-        
+        self.month_menu.set(self._month_name)
+        self.month_menu.grid(row=1, column=1, padx=5, pady=5, sticky="w")
+
         ctk.CTkLabel(date_frame, text="Year:").grid(row=1, column=2, padx=5, pady=5, sticky="w")
-        year_menu = ctk.CTkOptionMenu(
+        self.year_menu = ctk.CTkOptionMenu(
             date_frame,
-            values=[str(y) for y in years],
-            variable=self.year_var,
-            command=lambda _: self._update_date()
+            values=list(_YEAR_STRS[:now.year + 2 - _YEARS[0]]),
+            command=self._on_year_selected
         )
-        year_menu.grid(row=1, column=3, padx=5, pady=5, sticky="w")
+        self.year_menu.set(self._year_str)
+        self.year_menu.grid(row=1, column=3, padx=5, pady=5, sticky="w")
         
         # Output format
         format_frame = ctk.CTkFrame(content_frame)
@@ -172,31 +391,47 @@ class ReportDialog(ctk.CTkToplevel):
         )
         cancel_btn.pack(side="right", padx=5)
         
-        generate_btn = ctk.CTkButton(
+        self.generate_btn = ctk.CTkButton(
             button_frame,
             text="Generate Report",
             command=self._generate_report,
             width=150
         )
-        generate_btn.pack(side="right", padx=5)
+        self.generate_btn.pack(side="right", padx=5)
 
-    def _get_student_list(self) -> List[str]:
-        """Get list of all students with profiles."""
-        profiles_dir = PROFILES_DIR
-        students = set()
-        
-        for profile_file in profiles_dir.glob("*.json"):
-            try:
-                with open(profile_file, 'r', encoding='utf-8') as f:
-                    import json
-                    data = json.load(f)
-                    if 'student_name' in data:
-                        students.add(data['student_name'])
-            except (json.JSONDecodeError, OSError):
-                continue
-        
-        return sorted(students)
+        # Indeterminate progress indicator, shown while a report is
+        # being generated on the worker thread
+        self.progress_bar = ctk.CTkProgressBar(self, mode="indeterminate")
+
+    def _get_student_list(self) -> Tuple[str, ...]:
+        """Get all students with profiles."""
+        return _load_student_list_cached()
+
+    def _populate_students(self) -> None:
+        """Build the student list off the Tk thread, then apply it."""
+        names = self._get_student_list()
+        # Tk widgets may only be touched from the main thread
+        self.after(0, self._apply_student_list, names)
+
+    def _apply_student_list(self, names: Tuple[str, ...]) -> None:
+        """Replace the placeholder dropdown values with the real list."""
+        try:
+            # Starred unpacking into a tuple literal prepends without the
+            # intermediate list that list concatenation would copy
+            self.student_dropdown.configure(values=("All Students", *names))
+        except tk.TclError:
+            pass  # Dialog was closed before the scan finished
     
+    def _on_month_selected(self, value: str) -> None:
+        """Record the selected month and refresh dependent UI."""
+        self._month_name = value
+        self._update_date()
+
+    def _on_year_selected(self, value: str) -> None:
+        """Record the selected year and refresh dependent UI."""
+        self._year_str = value
+        self._update_date()
+
     def _update_date(self):
         """Update date-related UI elements."""
         pass  # Can be used for dynamic updates if needed
@@ -204,22 +439,17 @@ class ReportDialog(ctk.CTkToplevel):
     def _get_report_criteria(self) -> ReportCriteria:
         """Get report criteria from UI inputs."""
         student_name = None
-        if self.student_var.get() != "All Students":
-            student_name = self.student_var.get()
-        
+        if self._student != "All Students":
+            student_name = self._student
+
         report_type = self.report_type.get()
-        
+
         # For timeline, we don't filter by month/year
         month = None
         year = None
         if report_type != 'timeline':
-            month_name = self.month_var.get()
-            month = self._month_name_to_number.get(month_name)
-            year_str = self.year_var.get()
-            try:
-                year = int(year_str)
-            except (TypeError, ValueError):
-                year = None
+            month = _MONTH_NAME_TO_NUM.get(self._month_name)
+            year = _YEAR_STR_TO_INT.get(self._year_str)
         
         return ReportCriteria(
             student_name=student_name,
@@ -229,41 +459,82 @@ class ReportDialog(ctk.CTkToplevel):
         )
     
     def _generate_report(self):
-        """Generate the report based on current selections."""
+        """Start report generation on a worker thread."""
         criteria = self._get_report_criteria()
-        
+        output_format = self.format_var.get().lower()  # type: ignore
+
+        # Keep the dialog responsive while the extraction/export runs
+        self.generate_btn.configure(state="disabled")
+        self.progress_bar.grid(row=3, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self.progress_bar.start()
+
+        threading.Thread(
+            target=self._do_generate,
+            args=(criteria, output_format),
+            daemon=True
+        ).start()
+
+    def _do_generate(self, criteria: ReportCriteria, output_format: str) -> None:
+        """Worker: extract and export, then marshal the result back to Tk."""
         try:
-            # Show loading indicator
-            self.withdraw()
-            
-            # Generate report
-            reports = self.report_extractor.get_reports(criteria)
-            
+            # Reuse the last extraction for identical criteria
+            reports = self._report_cache.get(criteria)
+            if reports is None:
+                reports = self.report_extractor.get_reports(criteria)
+                self._report_cache[criteria] = reports
+                if len(self._report_cache) > 8:
+                    self._report_cache.popitem(last=False)
+
             if not reports:
-                tk.messagebox.showinfo("No Data", "No reports found matching the selected criteria.")
-                self.deiconify()
+                self.after(0, self._on_report_done, None, None)
                 return
-            
-            # Export report
-            output_format = self.format_var.get().lower()  # type: ignore
+
             output_path = self.report_exporter.export_report(
                 reports=reports,
                 output_format=output_format,  # type: ignore
                 criteria=criteria,
                 open_after=True
             )
-            
-            # Show success message
-            tk.messagebox.showinfo(
-                "Report Generated",
-                f"Report successfully generated and saved to:\n{output_path}"
-            )
-            
-            self.destroy()
-            
+            self.after(0, self._on_report_done, output_path, None)
         except Exception as e:
-            tk.messagebox.showerror("Error", f"Failed to generate report: {str(e)}")
-            self.deiconify()
+            self.after(0, self._on_report_done, None, e)
+
+    def _on_report_done(self, output_path: Optional[Path], error: Optional[Exception]) -> None:
+        """Main-thread completion handler for _do_generate."""
+        try:
+            self.progress_bar.stop()
+            self.progress_bar.grid_remove()
+            self.generate_btn.configure(state="normal")
+        except tk.TclError:
+            return  # Dialog already closed
+
+        if error is not None:
+            tk.messagebox.showerror("Error", f"Failed to generate report: {str(error)}")
+            return
+
+        if output_path is None:
+            tk.messagebox.showinfo("No Data", "No reports found matching the selected criteria.")
+            return
+
+        tk.messagebox.showinfo(
+            "Report Generated",
+            f"Report successfully generated and saved to:\n{output_path}"
+        )
+        self.destroy()
+
+def _open_path(path: Path) -> None:
+    """Open a file or directory in the platform file manager.
+
+    Hands the path straight to the OS opener instead of routing a
+    file:// URL through the web browser.
+    """
+    if sys.platform == 'win32':
+        os.startfile(path)  # Windows-only attribute
+    elif sys.platform == 'darwin':
+        subprocess.Popen(['open', str(path)])
+    else:
+        subprocess.Popen(['xdg-open', str(path)])
+
 
 def add_reporting_menu(parent: ctk.CTk) -> None:
     """Add reporting menu items to the main application.
@@ -283,12 +554,12 @@ def add_reporting_menu(parent: ctk.CTk) -> None:
     # Add menu items
     reports_menu.add_command(
         label="Generate Report...",
-        command=lambda: ReportDialog(parent)
+        command=lambda: ReportDialog.show(parent)
     )
     
     reports_menu.add_separator()
     
     reports_menu.add_command(
         label="Open Reports Directory",
-        command=lambda: webbrowser.open(f"file://{Path('reports').absolute()}")
+        command=lambda: _open_path(Path('reports').absolute())
     )
@@ -3,27 +3,124 @@
 Test runner script for Al-QuranCircle AutoFill Reports.
 
 Usage:
-    python run_tests.py              # Run all tests
-    python run_tests.py -v           # Run with verbose output
-    python run_tests.py test_utils   # Run specific test module
+    python run_tests.py              # Run all tests (one process per module)
+    python run_tests.py --serial     # Run everything in-process
+    python run_tests.py --no-cache   # Force a fresh test discovery
 """
 
+import io
+import json
+import os
 import sys
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import List, Tuple
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+TESTS_DIR = project_root / 'tests'
+MANIFEST_FILE = TESTS_DIR / '.cache' / 'manifest.json'
+
+
+def _module_names(suite: unittest.TestSuite) -> list:
+    """Flatten a discovered suite into its unique test module names."""
+    names = []
+    seen = set()
+    stack = [suite]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, unittest.TestSuite):
+            stack.extend(item)
+        else:
+            module = type(item).__module__
+            if module not in seen:
+                seen.add(module)
+                names.append(module)
+    return sorted(names)
+
+
+def _discover_module_names(use_cache: bool) -> List[str]:
+    """Get the test module names, skipping the directory walk when possible.
+
+    Discovery imports every test module and walks the tests directory on
+    each run. The discovered module names are cached in a manifest keyed
+    by the directory mtime, so repeat runs reuse the cached names
+    directly; adding or removing a test file bumps the mtime and
+    invalidates the manifest.
+    """
+    try:
+        dir_mtime_ns = os.stat(TESTS_DIR).st_mtime_ns
+    except OSError:
+        dir_mtime_ns = None
+
+    if use_cache and dir_mtime_ns is not None:
+        try:
+            with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('dir_mtime_ns') == dir_mtime_ns:
+                return list(manifest['modules'])
+        except (OSError, ValueError, KeyError):
+            pass  # Stale or corrupt manifest; fall through to discovery
+
+    suite = unittest.TestLoader().discover('tests', pattern='test_*.py')
+    modules = _module_names(suite)
+
+    if dir_mtime_ns is not None:
+        try:
+            MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = MANIFEST_FILE.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'dir_mtime_ns': dir_mtime_ns, 'modules': modules}, f)
+            os.replace(temp_file, MANIFEST_FILE)
+        except OSError:
+            pass  # Caching is best-effort
+
+    return modules
+
+
+def _run_module(module_name: str) -> Tuple[int, int, int, str]:
+    """Run one test module and return (run, failures, errors, output).
+
+    Module-level so it is picklable for the process pool; each worker
+    runs one module in isolation.
+    """
+    sys.path.insert(0, str(TESTS_DIR))
+    suite = unittest.TestLoader().loadTestsFromName(module_name)
+    stream = io.StringIO()
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    return result.testsRun, len(result.failures), len(result.errors), stream.getvalue()
+
+
 if __name__ == "__main__":
-    # Discover and run tests
-    loader = unittest.TestLoader()
-    suite = loader.discover('tests', pattern='test_*.py')
-    
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Exit with appropriate code
-    sys.exit(0 if result.wasSuccessful() else 1)
+    use_cache = '--no-cache' not in sys.argv
+    serial = '--serial' in sys.argv
+
+    modules = _discover_module_names(use_cache)
+
+    if serial or len(modules) < 2:
+        sys.path.insert(0, str(TESTS_DIR))
+        loader = unittest.TestLoader()
+        suite = loader.loadTestsFromNames(modules)
+        runner = unittest.TextTestRunner(verbosity=2)
+        result = runner.run(suite)
+        sys.exit(0 if result.wasSuccessful() else 1)
+
+    # One worker process per module: the modules are independent, so
+    # they run concurrently and a crash in one cannot take down the rest
+    total_run = total_failures = total_errors = 0
+    with ProcessPoolExecutor(max_workers=min(len(modules), os.cpu_count() or 1)) as executor:
+        for tests_run, failures, errors, output in executor.map(_run_module, modules):
+            sys.stderr.write(output)
+            total_run += tests_run
+            total_failures += failures
+            total_errors += errors
 
+    print(
+        f"Ran {total_run} tests "
+        f"({total_failures} failures, {total_errors} errors)",
+        file=sys.stderr
+    )
+    sys.exit(0 if total_failures == 0 and total_errors == 0 else 1)
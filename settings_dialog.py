@@ -1,11 +1,25 @@
 import customtkinter as ctk
 import logging
-from typing import Optional, Callable, Dict, Any
+import threading
+from functools import lru_cache
+from typing import Optional, Callable, Dict, Any, List
 from config import config
-from tkinter import messagebox
+from tkinter import filedialog, messagebox
 from utils import THEMES_DIR
 
 
+@lru_cache(maxsize=1)
+def _list_theme_files() -> List[str]:
+    """Scan the themes directory once and cache the available theme names.
+
+    The directory rarely changes during a session; call
+    _list_theme_files.cache_clear() to force a rescan.
+    """
+    if THEMES_DIR.is_dir():
+        return [f.stem for f in THEMES_DIR.iterdir() if f.suffix.lower() == ".json"]
+    return []
+
+
 class SettingsDialog(ctk.CTkToplevel):
     """Dialog for managing application settings."""
     
@@ -16,9 +30,24 @@ class SettingsDialog(ctk.CTkToplevel):
         self.resizable(True, True)
         self.on_save = on_save
 
+        # One settings snapshot for the whole dialog: every tab reads
+        # from this dict instead of traversing config per key, and only
+        # _save_settings writes back through config
+        self._cfg = config.get_all()
+
+        # Pending after() jobs for debounced slider handlers, keyed by
+        # slider name
+        self._after_jobs: Dict[str, str] = {}
+
+        # Section-header fonts shared by every tab; each CTkFont pins a
+        # Tcl font object, so one per style beats one per label
+        self._bold_font = ctk.CTkFont(weight="bold")
+        self._bold_font_lg = ctk.CTkFont(weight="bold", size=14)
+
         # Initialize all variables
         # Appearance
         self.theme_var = ctk.StringVar(value="system")
+        self.appearance_var = ctk.StringVar(value="system")
         self.font_family_var = ctk.StringVar(value="Arial")
         self.font_size_var = ctk.IntVar(value=12)
         self.scaling_var = ctk.DoubleVar(value=1.0)
@@ -47,17 +76,38 @@ class SettingsDialog(ctk.CTkToplevel):
         self.max_retries = ctk.IntVar(value=3)
         self.retry_delay = ctk.IntVar(value=5)
         
-        # Setup UI
-        self._setup_ui()
+        # Dotted config key -> variable, driving both load diffing and
+        # the save pass in _save_settings
+        self._field_map = {
+            "appearance.theme": self.appearance_var,
+            "appearance.color_theme": self.color_theme_var,
+            "appearance.font_family": self.font_family_var,
+            "appearance.font_size": self.font_size_var,
+            "appearance.ui_scaling": self.scaling_var,
+            "teacher.name": self.teacher_name_var,
+            "teacher.email": self.teacher_email_var,
+            "teacher.phone": self.teacher_phone_var,
+            "teacher.institution": self.teacher_institution_var,
+            "teacher.max_students": self.max_students_var,
+            "backup.auto_backup": self.auto_backup_var,
+            "backup.backup_count": self.backup_count_var,
+            "backup.backup_path": self.backup_path_var,
+            "reports.default_format": self.report_format_var,
+            "reports.include_logo": self.include_logo_var,
+            "reports.logo_path": self.logo_path_var,
+            "google_form.form_url": self.google_form_url,
+            "google_form.auto_submit": self.auto_submit,
+            "google_form.retries": self.max_retries,
+            "google_form.retry_delay": self.retry_delay,
+        }
+
+        # Load values first so the variables are populated when the
+        # widgets bind to them; the tab builders are pure UI wiring
         self._load_settings()
+        self._setup_ui()
     
     def _setup_ui(self):
         """Set up the main UI components of the settings dialog."""
-        # Make dialog modal
-        self.transient(self.master)
-        self.grab_set()
-        self.focus_force()
-        
         # Configure grid
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -69,25 +119,35 @@ class SettingsDialog(ctk.CTkToplevel):
         self.container.grid_columnconfigure(0, weight=1)
         
         # Create tabs
-        self.tabview = ctk.CTkTabview(self.container, corner_radius=0)
+        self.tabview = ctk.CTkTabview(
+            self.container, corner_radius=0, command=self._on_tab_changed
+        )
         self.tabview.grid(row=0, column=0, sticky="nsew", padx=0, pady=0)
-        
+
         # Add tabs
         self.tabview.add("Appearance")
         self.tabview.add("Teacher")
         self.tabview.add("Backup")
         self.tabview.add("Reports")
-        
+
         # Configure tab weights
         for tab in ["Appearance", "Teacher", "Backup", "Reports"]:
             self.tabview.tab(tab).grid_rowconfigure(0, weight=1)
             self.tabview.tab(tab).grid_columnconfigure(0, weight=1)
-        
-        # Setup individual tabs
-        self._setup_appearance_tab()
-        self._setup_teacher_tab()
-        self._setup_backup_tab()
-        self._setup_reports_tab()
+
+        # Widget construction dominates dialog-open time, so only the
+        # initially visible tab is built here; the others are built on
+        # first view by _on_tab_changed. The variables created in
+        # __init__ and filled by _load_settings cover _save_settings
+        # reads for tabs that were never shown.
+        self._tab_builders = {
+            "Appearance": self._setup_appearance_tab,
+            "Teacher": self._setup_teacher_tab,
+            "Backup": self._setup_backup_tab,
+            "Reports": self._setup_reports_tab,
+        }
+        self._built = set()
+        self._build_tab("Appearance")
         
         # Bottom buttons
         self.button_frame = ctk.CTkFrame(self.container, fg_color="transparent")
@@ -114,89 +174,124 @@ class SettingsDialog(ctk.CTkToplevel):
         # Bind Enter key to save
         self.bind('<Return>', self._on_save)
         self.bind('<Escape>', lambda e: self.destroy())
+
+        # Make the dialog modal only once the initial layout has been
+        # flushed: each of these calls is a synchronous window-server
+        # round-trip, and grabbing before the widgets exist forces a
+        # re-grab after they pack
+        self.after_idle(self._install_modal)
+
+    def _install_modal(self):
+        """Deferred modal setup: transient hint, grab and focus."""
+        self.transient(self.master)
+        self.grab_set()
+        self.focus_force()
+
+    def _debounced_var_set(self, key: str, var, value) -> None:
+        """Coalesce a burst of slider ticks into one variable write.
+
+        Every var.set fires Tk traces and widget redraws, so during a
+        drag only the last value within 50ms is applied.
+        """
+        job = self._after_jobs.pop(key, None)
+        if job is not None:
+            self.after_cancel(job)
+        self._after_jobs[key] = self.after(50, lambda: var.set(value))
+
+    def _build_tab(self, name: str) -> None:
+        """Build a tab's widgets the first time it is needed.
+
+        Geometry propagation is suspended while the builder runs: each
+        pack() call would otherwise reflow the tab immediately, so a
+        ~30-widget tab paid ~30 recomputes. With propagation off the
+        layout settles in one pass afterwards.
+        """
+        if name in self._built:
+            return
+        self._built.add(name)
+        tab = self.tabview.tab(name)
+        tab.pack_propagate(False)
+        try:
+            self._tab_builders[name]()
+        finally:
+            tab.pack_propagate(True)
+            tab.update_idletasks()
+
+    def _on_tab_changed(self) -> None:
+        """Tabview callback: build the newly selected tab on demand."""
+        self._build_tab(self.tabview.get())
+
     def _setup_appearance_tab(self):
         """Set up the appearance tab with theme and UI options."""
         tab = self.tabview.tab("Appearance")
-        
-        # --- Appearance Mode (System / Light / Dark) ---
-        theme_frame = ctk.CTkFrame(tab, corner_radius=0)
-        theme_frame.pack(fill="x", padx=10, pady=(10, 5))
-        
-        ctk.CTkLabel(theme_frame, text="Appearance", font=ctk.CTkFont(weight="bold")).pack(anchor="w", pady=(0, 10))
-        
-                # عند فتح الـ dialog
-        current_theme = config.get("appearance.theme", config.get("theme", "system"))
-        self.appearance_var = ctk.StringVar(value=current_theme)
 
-        ctk.CTkLabel(theme_frame, text="Mode:").pack(anchor="w")
+        # One section frame laid out with grid: every CTkFrame is a
+        # Canvas, so one card replaces the old theme/font pair
+        content = ctk.CTkFrame(tab, corner_radius=0)
+        content.pack(fill="x", padx=10, pady=(10, 5))
+        content.grid_columnconfigure(0, weight=1)
+
+        ctk.CTkLabel(content, text="Appearance", font=self._bold_font).grid(
+            row=0, column=0, sticky="w", pady=(0, 10))
+
+        # عند فتح الـ dialog
+        ctk.CTkLabel(content, text="Mode:").grid(row=1, column=0, sticky="w")
         appearance_menu = ctk.CTkOptionMenu(
-            theme_frame,
+            content,
             values=["system", "light", "dark"],
             variable=self.appearance_var,
             command=self._on_appearance_select  # ← استخدم handler جديد
         )
-        appearance_menu.pack(fill="x", pady=(0, 10))
-        
+        appearance_menu.grid(row=2, column=0, sticky="ew", pady=(0, 10))
+
         # --- Color Theme (Default + JSON files) ---
         default_themes = ["blue"]
-        
-        theme_files = []
-        if THEMES_DIR.exists() and THEMES_DIR.is_dir():
-            theme_files = [f.stem for f in THEMES_DIR.iterdir() if f.suffix.lower() == ".json"]
-        
-        all_themes = default_themes + theme_files
-        
-        self.color_theme_var = ctk.StringVar(value=config.get("appearance.color_theme", "blue"))
-        ctk.CTkLabel(theme_frame, text="Color Theme:").pack(anchor="w")
+        all_themes = default_themes + _list_theme_files()
+
+        ctk.CTkLabel(content, text="Color Theme:").grid(row=3, column=0, sticky="w")
         color_menu = ctk.CTkOptionMenu(
-            theme_frame,
+            content,
             values=all_themes,
             variable=self.color_theme_var,
             command=self._on_color_theme_select  # ← handler جديد
         )
-        color_menu.pack(fill="x", pady=(0, 10))
-            
+        color_menu.grid(row=4, column=0, sticky="ew", pady=(0, 10))
+
         # UI Scaling
-        self.scaling_var = ctk.DoubleVar(value=config.get("appearance.ui_scaling", 1.0))
-        ctk.CTkLabel(theme_frame, text="UI Scaling:").pack(anchor="w")
+        ctk.CTkLabel(content, text="UI Scaling:").grid(row=5, column=0, sticky="w")
         scaling_slider = ctk.CTkSlider(
-            theme_frame,
+            content,
             from_=0.5,
             to=2.0,
             number_of_steps=15,
             variable=self.scaling_var,
-            command=lambda v: self.scaling_var.set(round(v, 1))
+            command=lambda v: self._debounced_var_set("scaling", self.scaling_var, round(v, 1))
         )
-        scaling_slider.pack(fill="x", pady=(0, 10))
-        
+        scaling_slider.grid(row=6, column=0, sticky="ew", pady=(0, 10))
+
         # Font settings
-        font_frame = ctk.CTkFrame(tab, corner_radius=0)
-        font_frame.pack(fill="x", padx=10, pady=(5, 5))
-        
         ctk.CTkLabel(
-            font_frame, 
+            content,
             text="Font Settings",
-            font=ctk.CTkFont(weight="bold")
-        ).pack(anchor="w", pady=(0, 10))
-        
+            font=self._bold_font
+        ).grid(row=7, column=0, sticky="w", pady=(10, 10))
+
         # Font family
-        self.font_family_var = ctk.StringVar(value=config.get("appearance.font_family", "Arial"))
-        ctk.CTkLabel(font_frame, text="Font Family:").pack(anchor="w")
-        font_family_entry = ctk.CTkEntry(font_frame, textvariable=self.font_family_var)
-        font_family_entry.pack(fill="x", pady=(0, 10))
-        
+        ctk.CTkLabel(content, text="Font Family:").grid(row=8, column=0, sticky="w")
+        font_family_entry = ctk.CTkEntry(content, textvariable=self.font_family_var)
+        font_family_entry.grid(row=9, column=0, sticky="ew", pady=(0, 10))
+
         # Font size
-        self.font_size_var = ctk.IntVar(value=config.get("appearance.font_size", 12))
-        ctk.CTkLabel(font_frame, text="Font Size:").pack(anchor="w")
+        ctk.CTkLabel(content, text="Font Size:").grid(row=10, column=0, sticky="w")
         font_size_slider = ctk.CTkSlider(
-            font_frame,
+            content,
             from_=8,
             to=24,
             number_of_steps=16,
             variable=self.font_size_var,
-            command=lambda v: self.font_size_var.set(int(v))
+            command=lambda v: self._debounced_var_set("font_size", self.font_size_var, int(v))
         )
-        font_size_slider.pack(fill="x", pady=(0, 10))
+        font_size_slider.grid(row=11, column=0, sticky="ew", pady=(0, 10))
 
 
     # --- Handlers الجديدة ---
@@ -237,30 +332,28 @@ class SettingsDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             teacher_frame, 
             text="Teacher Information",
-            font=ctk.CTkFont(weight="bold")
+            font=self._bold_font
         ).pack(anchor="w", pady=(0, 15))
         
+        # The entries bind to the variables created in __init__ and
+        # filled by _load_settings
         # Name
         ctk.CTkLabel(teacher_frame, text="Full Name:").pack(anchor="w")
-        self.teacher_name_var = ctk.StringVar()
         name_entry = ctk.CTkEntry(teacher_frame, textvariable=self.teacher_name_var)
         name_entry.pack(fill="x", pady=(0, 10))
-        
+
         # Email
         ctk.CTkLabel(teacher_frame, text="Email:").pack(anchor="w")
-        self.teacher_email_var = ctk.StringVar()
         email_entry = ctk.CTkEntry(teacher_frame, textvariable=self.teacher_email_var)
         email_entry.pack(fill="x", pady=(0, 10))
-        
+
         # Phone
         ctk.CTkLabel(teacher_frame, text="Phone:").pack(anchor="w")
-        self.teacher_phone_var = ctk.StringVar()
         phone_entry = ctk.CTkEntry(teacher_frame, textvariable=self.teacher_phone_var)
         phone_entry.pack(fill="x", pady=(0, 10))
-        
+
         # Institution
         ctk.CTkLabel(teacher_frame, text="Institution:").pack(anchor="w")
-        self.teacher_institution_var = ctk.StringVar()
         institution_entry = ctk.CTkEntry(teacher_frame, textvariable=self.teacher_institution_var)
         institution_entry.pack(fill="x", pady=(0, 10))
 
@@ -272,208 +365,171 @@ class SettingsDialog(ctk.CTkToplevel):
         backup_frame = ctk.CTkFrame(tab, corner_radius=0)
         backup_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
+        # The section frame is laid out with grid so the backup-location
+        # entry and button can share a row directly, without the
+        # transparent wrapper frame (every CTkFrame is its own canvas)
+        backup_frame.grid_columnconfigure(0, weight=1)
+
         ctk.CTkLabel(
-            backup_frame, 
+            backup_frame,
             text="Backup Settings",
-            font=ctk.CTkFont(weight="bold")
-        ).pack(anchor="w", pady=(0, 15))
-        
+            font=self._bold_font
+        ).grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 15))
+
         # Auto backup
-        self.auto_backup_var = ctk.BooleanVar(value=config.get("backup.auto_backup", True))
         auto_backup_switch = ctk.CTkSwitch(
             backup_frame,
             text="Enable Auto Backup",
             variable=self.auto_backup_var
         )
-        auto_backup_switch.pack(anchor="w", pady=(0, 10))
-        
+        auto_backup_switch.grid(row=1, column=0, columnspan=2, sticky="w", pady=(0, 10))
+
         # Number of backups to keep
-        ctk.CTkLabel(backup_frame, text="Number of Backups to Keep:").pack(anchor="w")
-        self.backup_count_var = ctk.IntVar(value=config.get("backup.backup_count", 5))
+        ctk.CTkLabel(backup_frame, text="Number of Backups to Keep:").grid(
+            row=2, column=0, columnspan=2, sticky="w")
         backup_count_slider = ctk.CTkSlider(
             backup_frame,
             from_=1,
             to=20,
             number_of_steps=19,
             variable=self.backup_count_var,
-            command=lambda v: self.backup_count_var.set(int(v))
-        )
-        backup_count_slider.pack(fill="x", pady=(0, 10))
-        
-        # Backup location
-        ctk.CTkLabel(backup_frame, text="Backup Location:").pack(anchor="w")
-        backup_loc_frame = ctk.CTkFrame(backup_frame, fg_color="transparent")
-        backup_loc_frame.pack(fill="x", pady=(0, 10))
-        
-        self.backup_path_var = ctk.StringVar(value=config.get("backup.backup_path", ""))
-        backup_path_entry = ctk.CTkEntry(backup_loc_frame, textvariable=self.backup_path_var)
-        backup_path_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
-        
-        browse_btn = ctk.CTkButton(
-            backup_loc_frame,
-            text="Browse...",
-            width=80,
-            command=self._browse_backup_location
-        )
-        browse_btn.pack(side="right")
-        # Reports Frame
-        reports_frame = ctk.CTkFrame(tab, corner_radius=0)
-        reports_frame.pack(fill="both", expand=True, padx=10, pady=10)
-
-        ctk.CTkLabel(
-            reports_frame,
-            text="Logo Settings",
-            font=ctk.CTkFont(weight="bold")
-        ).pack(anchor="w", pady=(0, 15))
-
-        # Reports Settings Frame
-        reports_settings_frame = ctk.CTkFrame(reports_frame, fg_color="transparent")
-        reports_settings_frame.pack(fill="x", pady=(0, 10))
-
-        # Default Format
-        ctk.CTkLabel(reports_settings_frame, text="Default Format:").pack(anchor="w")
-        self.report_format_var = ctk.StringVar(value=config.get("reports.default_format", "pdf"))
-        format_menu = ctk.CTkOptionMenu(
-            reports_settings_frame,
-            values=["pdf", "html"],
-            variable=self.report_format_var
-        )
-        format_menu.pack(fill="x", pady=(0, 10))
-
-        # Include Logo Checkbox
-        self.include_logo_var = ctk.BooleanVar(value=config.get("reports.include_logo", True))
-        include_logo_cb = ctk.CTkCheckBox(
-            reports_settings_frame,
-            text="Include logo in generated reports",
-            variable=self.include_logo_var
+            command=lambda v: self._debounced_var_set("backup_count", self.backup_count_var, int(v))
         )
-        include_logo_cb.pack(anchor="w", pady=(0, 10))
-
-        # Logo Path
-        ctk.CTkLabel(reports_frame, text="Logo Path:").pack(anchor="w")
-        logo_loc_frame = ctk.CTkFrame(reports_frame, fg_color="transparent")
-        logo_loc_frame.pack(fill="x", pady=(0, 10))
+        backup_count_slider.grid(row=3, column=0, columnspan=2, sticky="ew", pady=(0, 10))
 
-        self.logo_path_var = ctk.StringVar(
-            value=config.get("reports.logo_path", "")
-        )
+        # Backup location
+        ctk.CTkLabel(backup_frame, text="Backup Location:").grid(
+            row=4, column=0, columnspan=2, sticky="w")
 
-        logo_path_entry = ctk.CTkEntry(
-            logo_loc_frame,
-            textvariable=self.logo_path_var
-        )
-        logo_path_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
+        backup_path_entry = ctk.CTkEntry(backup_frame, textvariable=self.backup_path_var)
+        backup_path_entry.grid(row=5, column=0, sticky="ew", padx=(0, 5), pady=(0, 10))
 
-        browse_logo_btn = ctk.CTkButton(
-            logo_loc_frame,
+        browse_btn = ctk.CTkButton(
+            backup_frame,
             text="Browse...",
             width=80,
-            command=self._browse_logo_location
-        )
-        browse_logo_btn.pack(side="right")
-
-
-    def _browse_logo_location(self):
-        from tkinter import filedialog
-        file_path = filedialog.askopenfilename(
-            title="Select Logo Image",
-            filetypes=[
-                ("Image Files", "*.png *.jpg *.jpeg *.gif *.bmp"),
-                ("All Files", "*.*")
-            ]
+            command=self._browse_backup_location
         )
-        if file_path:
-            self.logo_path_var.set(file_path)
+        browse_btn.grid(row=5, column=1, pady=(0, 10))
 
     def _setup_reports_tab(self):
         """Set up the reports and Google Form settings tab."""
         tab = self.tabview.tab("Reports")
         tab.grid_columnconfigure(0, weight=1)
         
-        # Main container with scrollbar
-        main_frame = ctk.CTkScrollableFrame(tab)
+        # Plain frame: the tab's content fits the dialog, so the canvas
+        # and scrollbar a CTkScrollableFrame drags in would only add
+        # reflow cost on every resize
+        main_frame = ctk.CTkFrame(tab, fg_color="transparent")
         main_frame.pack(fill="both", expand=True, padx=10, pady=10)
         main_frame.grid_columnconfigure(0, weight=1)
         
+        # The whole tab is one grid on main_frame: the horizontal rows
+        # (URL + button, retry fields, logo path + button) grid directly
+        # instead of sitting in transparent wrapper frames, each of
+        # which would be another canvas
+        main_frame.grid_columnconfigure(1, weight=1)
+
         # Google Form Section
-        google_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-        google_frame.pack(fill="x", pady=(0, 20))
-        
         ctk.CTkLabel(
-            google_frame,
+            main_frame,
             text="Google Form Integration",
-            font=ctk.CTkFont(weight="bold", size=14)
-        ).pack(anchor="w", pady=(0, 10))
-        
+            font=self._bold_font_lg
+        ).grid(row=0, column=0, columnspan=4, sticky="w", pady=(0, 10))
+
         # Form URL
-        form_url_frame = ctk.CTkFrame(google_frame, fg_color="transparent")
-        form_url_frame.pack(fill="x", pady=(0, 10))
-        
-        ctk.CTkLabel(form_url_frame, text="Form URL:").pack(anchor="w")
-        self.google_form_url = ctk.StringVar()
+        ctk.CTkLabel(main_frame, text="Form URL:").grid(
+            row=1, column=0, columnspan=4, sticky="w")
         url_entry = ctk.CTkEntry(
-            form_url_frame,
+            main_frame,
             textvariable=self.google_form_url,
             placeholder_text="https://docs.google.com/forms/d/e/...",
             width=400
         )
-        url_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
-        
+        url_entry.grid(row=2, column=0, columnspan=3, sticky="ew", padx=(0, 5), pady=(0, 10))
+
         # Test Connection Button
         test_btn = ctk.CTkButton(
-            form_url_frame,
+            main_frame,
             text="Test Connection",
             width=120,
             command=self._test_google_form_connection
         )
-        test_btn.pack(side="right")
-        
+        test_btn.grid(row=2, column=3, pady=(0, 10))
+
         # Auto-submit option
-        self.auto_submit = ctk.BooleanVar(value=False)
         auto_submit_switch = ctk.CTkSwitch(
-            google_frame,
+            main_frame,
             text="Auto-submit after filling",
             variable=self.auto_submit
         )
-        auto_submit_switch.pack(anchor="w", pady=(0, 15))
-        
+        auto_submit_switch.grid(row=3, column=0, columnspan=4, sticky="w", pady=(0, 15))
+
         # Retry settings
-        retry_frame = ctk.CTkFrame(google_frame, fg_color="transparent")
-        retry_frame.pack(fill="x", pady=(0, 10))
-        
-        ctk.CTkLabel(retry_frame, text="Max Retries:").pack(side="left", padx=(0, 5))
-        self.max_retries = ctk.IntVar(value=3)
+        ctk.CTkLabel(main_frame, text="Max Retries:").grid(
+            row=4, column=0, sticky="w", padx=(0, 5))
         retry_spin = ctk.CTkEntry(
-            retry_frame,
+            main_frame,
             textvariable=self.max_retries,
             width=50
         )
-        retry_spin.pack(side="left", padx=(0, 15))
-        
-        ctk.CTkLabel(retry_frame, text="Retry Delay (seconds):").pack(side="left", padx=(0, 5))
-        self.retry_delay = ctk.IntVar(value=5)
+        retry_spin.grid(row=4, column=1, sticky="w", padx=(0, 15), pady=(0, 10))
+
+        ctk.CTkLabel(main_frame, text="Retry Delay (seconds):").grid(
+            row=4, column=2, sticky="w", padx=(0, 5))
         delay_spin = ctk.CTkEntry(
-            retry_frame,
+            main_frame,
             textvariable=self.retry_delay,
             width=50
         )
-        delay_spin.pack(side="left")
-        
+        delay_spin.grid(row=4, column=3, sticky="w", pady=(0, 10))
+
         # Add a separator
-        ctk.CTkFrame(google_frame, height=1, fg_color="gray30").pack(fill="x", pady=20)
-        
-        # Rest of your reports settings...
-        
-        # Load current settings
-        self._load_google_form_settings()
+        ctk.CTkFrame(main_frame, height=1, fg_color="gray30").grid(
+            row=5, column=0, columnspan=4, sticky="ew", pady=20)
 
-    def _load_google_form_settings(self):
-        """Load Google Form settings from config."""
-        settings = config.get_google_form_settings()
-        self.google_form_url.set(settings["form_url"])
-        self.auto_submit.set(settings["auto_submit"])
-        self.max_retries.set(settings["retries"])
-        self.retry_delay.set(settings["retry_delay"])
+        # Report output section (format, logo)
+        ctk.CTkLabel(
+            main_frame,
+            text="Report Output",
+            font=self._bold_font_lg
+        ).grid(row=6, column=0, columnspan=4, sticky="w", pady=(0, 10))
+
+        # Default Format
+        ctk.CTkLabel(main_frame, text="Default Format:").grid(
+            row=7, column=0, columnspan=4, sticky="w")
+        format_menu = ctk.CTkOptionMenu(
+            main_frame,
+            values=["pdf", "html"],
+            variable=self.report_format_var
+        )
+        format_menu.grid(row=8, column=0, columnspan=4, sticky="ew", pady=(0, 10))
+
+        # Include Logo Checkbox
+        include_logo_cb = ctk.CTkCheckBox(
+            main_frame,
+            text="Include logo in generated reports",
+            variable=self.include_logo_var
+        )
+        include_logo_cb.grid(row=9, column=0, columnspan=4, sticky="w", pady=(0, 10))
+
+        # Logo Path
+        ctk.CTkLabel(main_frame, text="Logo Path:").grid(
+            row=10, column=0, columnspan=4, sticky="w")
+
+        logo_path_entry = ctk.CTkEntry(
+            main_frame,
+            textvariable=self.logo_path_var
+        )
+        logo_path_entry.grid(row=11, column=0, columnspan=3, sticky="ew", padx=(0, 5), pady=(0, 10))
+
+        browse_logo_btn = ctk.CTkButton(
+            main_frame,
+            text="Browse...",
+            width=80,
+            command=self._browse_logo_location
+        )
+        browse_logo_btn.grid(row=11, column=3, pady=(0, 10))
 
     def _save_google_form_settings(self) -> bool:
         """Save Google Form settings to config."""
@@ -495,41 +551,53 @@ class SettingsDialog(ctk.CTkToplevel):
         # Clean up the URL
         url = raw_url.strip()
         
-        # Show loading state
+        # Show loading state, then test off the Tk thread so the GUI
+        # keeps rendering while the request is in flight
         self.save_btn.configure(state="disabled")
-        self.after(100, self._perform_connection_test, url)
+        threading.Thread(
+            target=self._perform_connection_test,
+            args=(url,),
+            daemon=True
+        ).start()
 
     def _perform_connection_test(self, url: str):
-        """Perform the actual connection test (run in main thread)."""
-        try:
-            # Add your actual connection test logic here
-            # For now, we'll just simulate a test
-            import time
-            time.sleep(1)  # Simulate network delay
-            
-            # Check if URL looks like a Google Form URL
-            if "docs.google.com/forms/" in url:
-                messagebox.showinfo("Success", "Successfully connected to Google Form!")
-            else:
-                messagebox.showwarning("Warning", "The URL doesn't appear to be a Google Form")
-                
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to connect to Google Form: {str(e)}")
-        finally:
-            self.save_btn.configure(state="normal")
+        """Worker: check the form URL, then marshal the result back to Tk."""
+        import requests
+
+        if "docs.google.com/forms/" not in url:
+            level, msg = "warning", "The URL doesn't appear to be a Google Form"
+        else:
+            try:
+                response = requests.head(url, timeout=3, allow_redirects=True)
+                if response.status_code < 400:
+                    level, msg = "info", "Successfully connected to Google Form!"
+                else:
+                    level, msg = "warning", f"The form responded with HTTP {response.status_code}"
+            except requests.RequestException as e:
+                level, msg = "error", f"Failed to connect to Google Form: {str(e)}"
+
+        self.after(0, self._finish_connection_test, level, msg)
+
+    def _finish_connection_test(self, level: str, msg: str):
+        """Main-thread completion handler for the connection test."""
+        self.save_btn.configure(state="normal")
+        if level == "info":
+            messagebox.showinfo("Success", msg)
+        elif level == "warning":
+            messagebox.showwarning("Warning", msg)
+        else:
+            messagebox.showerror("Error", msg)
 
     # Update the save method to include Google Form settings
     
     def _browse_backup_location(self):
         """Open a directory dialog to select backup location."""
-        from tkinter import filedialog
         path = filedialog.askdirectory(title="Select Backup Location")
         if path:
             self.backup_path_var.set(path)
     
     def _browse_logo_location(self):
         """Open a file dialog to select logo image."""
-        from tkinter import filedialog
         filetypes = [
             ("Image files", "*.png *.jpg *.jpeg *.gif *.bmp"),
             ("All files", "*.*")
@@ -547,20 +615,22 @@ class SettingsDialog(ctk.CTkToplevel):
         self.theme_var.set(theme)
     
     def _load_settings(self):
-        """Load current settings into the dialog."""
+        """Load current settings into the dialog from the snapshot."""
         try:
             # Appearance
-            appearance = config.get("appearance", {})
+            appearance = self._cfg.get("appearance", {})
             theme_value = appearance.get("theme")
             if not theme_value:
-                theme_value = config.get("theme", "system")
+                theme_value = self._cfg.get("theme", "system")
             self.theme_var.set(theme_value)
+            self.appearance_var.set(theme_value)
+            self.color_theme_var.set(appearance.get("color_theme", "blue"))
             self.font_family_var.set(appearance.get("font_family", "Arial"))
             self.font_size_var.set(appearance.get("font_size", 12))
             self.scaling_var.set(appearance.get("ui_scaling", 1.0))
             
             # Teacher
-            teacher = config.get("teacher", {})
+            teacher = self._cfg.get("teacher", {})
             self.teacher_name_var.set(teacher.get("name", ""))
             self.teacher_email_var.set(teacher.get("email", ""))
             self.teacher_phone_var.set(teacher.get("phone", ""))
@@ -568,25 +638,23 @@ class SettingsDialog(ctk.CTkToplevel):
             self.max_students_var.set(teacher.get("max_students", 30))
             
             # Backup
-            backup = config.get("backup", {})
+            backup = self._cfg.get("backup", {})
             self.auto_backup_var.set(backup.get("auto_backup", True))
             self.backup_count_var.set(backup.get("backup_count", 5))
             self.backup_path_var.set(backup.get("backup_path", ""))
             
             # Reports
-            reports = config.get("reports", {})
+            reports = self._cfg.get("reports", {})
             self.report_format_var.set(reports.get("default_format", "pdf"))
             self.include_logo_var.set(reports.get("include_logo", True))
             self.logo_path_var.set(reports.get("logo_path", ""))
             
             # Google Form
-            google_form = config.get("google_form", {})
+            google_form = self._cfg.get("google_form", {})
             self.google_form_url.set(google_form.get("form_url", ""))
             self.auto_submit.set(google_form.get("auto_submit", False))
             self.max_retries.set(google_form.get("retries", 3))
             self.retry_delay.set(google_form.get("retry_delay", 5))
-            # Save logo path to config
-            config.set("reports.logo_path", reports.get("logo_path", ""))
         except Exception as e:
             logging.error(f"Error loading settings: {e}", exc_info=True)
             
@@ -665,55 +733,22 @@ class SettingsDialog(ctk.CTkToplevel):
         """Save settings from the dialog to config and apply them immediately."""
         try:
             # --- حفظ الإعدادات في Config ---
-            # Appearance
-            config.set("appearance.theme", self.appearance_var.get())
-            config.set("appearance.color_theme", self.color_theme_var.get())
-            config.set("appearance.font_family", self.font_family_var.get())
-            config.set("appearance.font_size", self.font_size_var.get())
-            config.set("appearance.ui_scaling", self.scaling_var.get())
-            
-            # Teacher
-            teacher_info = {
-                "name": self.teacher_name_var.get().strip(),
-                "email": self.teacher_email_var.get().strip(),
-                "phone": self.teacher_phone_var.get().strip(),
-                "institution": self.teacher_institution_var.get().strip(),
-                "max_students": self.max_students_var.get()
-            }
-            config.set("teacher", teacher_info)
-            
-            # Backup
-            backup_info = {
-                "auto_backup": self.auto_backup_var.get(),
-                "backup_count": self.backup_count_var.get(),
-                "backup_path": self.backup_path_var.get().strip()
-            }
-            config.set("backup", backup_info)
-            
-            # Reports
-            report_info = {
-                "default_format": self.report_format_var.get(),
-                "include_logo": self.include_logo_var.get(),
-                "logo_path": self.logo_path_var.get().strip()
-            }
-            config.set("reports", report_info)
-            
-            # Google Form
-            google_form_info = {
-                "form_url": self.google_form_url.get().strip(),
-                "auto_submit": self.auto_submit.get(),
-                "retries": self.max_retries.get(),
-                "retry_delay": self.retry_delay.get()
-            }
-            config.set("google_form", google_form_info)
-            
-            # حفظ كل شيء على القرص أولًا
-            if not config.save_settings():
-                raise Exception("Failed to save settings to disk")
-            
+            # One pass over the field map instead of hand-written section
+            # dicts; set_many diffs each key against the stored value and
+            # coalesces everything into at most one disk write
+            updates = {}
+            for key, var in self._field_map.items():
+                value = var.get()
+                if isinstance(value, str):
+                    value = value.strip()
+                updates[key] = value
+
+            if not config.set_many(updates):
+                raise Exception("Failed to save settings")
+
             # --- تطبيق الإعدادات على التطبيق فورًا ---
             self._apply_appearance_settings()
-            
+
             return True
 
         except Exception as e:
@@ -721,22 +756,36 @@ class SettingsDialog(ctk.CTkToplevel):
             return False
 
           
-    def _on_save(self):
-        if self._save_settings():
-            # إعلام المستخدم
-            messagebox.showinfo(
-                "Settings Saved",
-                "Your settings have been saved successfully!\n"
-                "Please restart the application manually to apply the new settings."
-            )
+    def _on_save(self, event=None):
+        if not self._save_settings():
+            return
 
-            # اغلاق نافذة الإعدادات
-            self.destroy()
+        # --- تطبيق الإعدادات الحية بدل إعادة تشغيل التطبيق ---
+        scaling = self.scaling_var.get()
+        ctk.set_widget_scaling(scaling)
+        ctk.set_window_scaling(scaling)
 
-            # اغلاق Main UI إذا موجود
-            if hasattr(self.master, "destroy"):
-                self.master.destroy()
+        if self.on_save:
+            self.on_save()
 
-            # إنهاء العملية بالكامل
-            import sys
-            sys.exit(0)
+        # Only the font family genuinely needs a restart to take effect
+        # everywhere; offer it instead of forcing one for every save
+        old_font = self._cfg.get("appearance", {}).get("font_family", "Arial")
+        if self.font_family_var.get() != old_font:
+            restart = messagebox.askyesno(
+                "Settings Saved",
+                "Your settings have been saved and applied.\n"
+                "The font change takes full effect after a restart — "
+                "close the application now?"
+            )
+            if restart:
+                self.destroy()
+                if hasattr(self.master, "destroy"):
+                    self.master.destroy()
+                return
+
+        messagebox.showinfo(
+            "Settings Saved",
+            "Your settings have been saved and applied."
+        )
+        self.destroy()
@@ -0,0 +1,14 @@
+"""Shared test setup: put the project root on sys.path once.
+
+Each test module used to insert the parent directory itself at import
+time; doing it here keeps sys.path short and the insert happens a
+single time per run. Picked up automatically by pytest; unittest
+discovery runs from the project root (via run_tests.py), where the
+root is already on sys.path.
+"""
+import sys
+from pathlib import Path
+
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
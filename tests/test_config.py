@@ -1,17 +1,10 @@
 """Unit tests for config module."""
 import unittest
 import tempfile
-import shutil
 import json
 from pathlib import Path
 
-# Import the module to test
-import sys
-from pathlib import Path as PathLib
-
-# Add parent directory to path
-sys.path.insert(0, str(PathLib(__file__).parent.parent))
-
+# Project root is on sys.path via tests/conftest.py (or the test runner)
 from config import ConfigManager, DEFAULT_SETTINGS
 
 
@@ -22,18 +15,22 @@ class TestConfigManager(unittest.TestCase):
         """Set up test environment."""
         # Reset singleton instance
         ConfigManager._instance = None
-        # Create temporary config directory
-        self.temp_dir = Path(tempfile.mkdtemp())
+        # Create temporary config directory; TemporaryDirectory handles
+        # its own scandir-based teardown
+        self._tmp = tempfile.TemporaryDirectory()
+        self.temp_dir = Path(self._tmp.name)
         ConfigManager._config_path = self.temp_dir / "config"
         ConfigManager._settings_file = ConfigManager._config_path / "settings.json"
-    
+
     def tearDown(self):
         """Clean up test environment."""
+        # Land any debounced write now so the pending timer can't fire
+        # after the temp directory is gone
+        if ConfigManager._instance is not None:
+            ConfigManager._instance._flush()
         # Reset singleton
         ConfigManager._instance = None
-        # Clean up temporary directory
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+        self._tmp.cleanup()
     
     def test_singleton_pattern(self):
         """Test that ConfigManager is a singleton."""
@@ -1,17 +1,10 @@
 """Unit tests for utils module."""
 import unittest
 import tempfile
-import shutil
 from pathlib import Path
 from datetime import datetime
 
-# Import the module to test
-import sys
-from pathlib import Path as PathLib
-
-# Add parent directory to path
-sys.path.insert(0, str(PathLib(__file__).parent.parent))
-
+# Project root is on sys.path via tests/conftest.py (or the test runner)
 from utils import (
     validate_email,
     sanitize_filename,
@@ -35,9 +28,10 @@ class TestValidationFunctions(unittest.TestCase):
             "user+tag@example.com",
             "user_123@test-domain.com",
         ]
-        for email in valid_emails:
-            with self.subTest(email=email):
-                self.assertTrue(validate_email(email), f"{email} should be valid")
+        # Plain loop instead of subTest: no per-row context manager, and
+        # failures are aggregated so one run still reports every bad row
+        failures = [email for email in valid_emails if not validate_email(email)]
+        self.assertFalse(failures, f"Should be valid: {failures}")
     
     def test_validate_email_invalid(self):
         """Test invalid email addresses."""
@@ -50,9 +44,8 @@ class TestValidationFunctions(unittest.TestCase):
             "",
             None,
         ]
-        for email in invalid_emails:
-            with self.subTest(email=email):
-                self.assertFalse(validate_email(email), f"{email} should be invalid")
+        failures = [email for email in invalid_emails if validate_email(email)]
+        self.assertFalse(failures, f"Should be invalid: {failures}")
     
     def test_sanitize_filename(self):
         """Test filename sanitization."""
@@ -114,10 +107,12 @@ class TestValidationFunctions(unittest.TestCase):
             (None, ""),
             (123, "123"),
         ]
-        for input_val, expected in test_cases:
-            with self.subTest(input=input_val):
-                result = sanitize_string(input_val)
-                self.assertEqual(result, expected)
+        failures = [
+            (input_val, expected, sanitize_string(input_val))
+            for input_val, expected in test_cases
+            if sanitize_string(input_val) != expected
+        ]
+        self.assertFalse(failures, f"(input, expected, got): {failures}")
 
 
 class TestProfileManagement(unittest.TestCase):
@@ -125,18 +120,18 @@ class TestProfileManagement(unittest.TestCase):
     
     def setUp(self):
         """Set up test environment."""
-        # Create temporary directory for profiles
-        self.temp_dir = Path(tempfile.mkdtemp())
+        # Create temporary directory for profiles; TemporaryDirectory
+        # handles its own scandir-based teardown
+        self._tmp = tempfile.TemporaryDirectory()
+        self.temp_dir = Path(self._tmp.name)
         self.original_profiles_dir = PROFILES_DIR
         # Note: We can't easily mock PROFILES_DIR without refactoring,
         # so these tests will use the actual directory
         # In a production test suite, you'd use dependency injection or mocking
-    
+
     def tearDown(self):
         """Clean up test environment."""
-        # Clean up temporary directory if created
-        if hasattr(self, 'temp_dir') and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+        self._tmp.cleanup()
     
     def test_save_and_load_profile(self):
         """Test saving and loading a profile."""
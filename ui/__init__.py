@@ -15,32 +15,42 @@ from .dialogs import ProfileHistoryDialog, BatchSubmitDialog
 # Import StudentManagerApp from parent ui.py file
 # Since main_window.py doesn't exist yet, we import directly from ui.py
 # We need to do this carefully to avoid circular imports
+import functools
 import sys
+import threading
 import importlib.util
 from pathlib import Path
 
-# Get the parent ui.py file
-parent_dir = Path(__file__).parent.parent
-ui_py_path = parent_dir / "ui.py"
+# Path to the parent ui.py file
+_UI_PY_PATH = Path(__file__).parent.parent / "ui.py"
 
-if ui_py_path.exists():
-    # Load ui.py as a separate module to avoid circular imports
-    # Use a unique module name to prevent conflicts
+
+@functools.lru_cache(maxsize=1)
+def _load_legacy_ui():
+    """Load ui.py as a separate module and return StudentManagerApp.
+
+    The cache makes repeat calls a plain dict lookup, and skipping the
+    up-front exists() probe means the cold path pays one syscall in
+    exec_module instead of a stat plus the open.
+    """
+    # Use a unique module name to prevent conflicts and circular imports
     module_name = "_ui_legacy_module"
-    if module_name not in sys.modules:
-        spec = importlib.util.spec_from_file_location(module_name, ui_py_path)
+    ui_legacy = sys.modules.get(module_name)
+    if ui_legacy is None:
+        spec = importlib.util.spec_from_file_location(module_name, _UI_PY_PATH)
         ui_legacy = importlib.util.module_from_spec(spec)
-        # Execute the module - it will fall back to defining classes locally
-        # since importing from ui.ui will fail (which is what we want)
-        spec.loader.exec_module(ui_legacy)
-        StudentManagerApp = ui_legacy.StudentManagerApp
+        try:
+            # Execute the module - it will fall back to defining classes
+            # locally since importing from ui.ui will fail (which is
+            # what we want)
+            spec.loader.exec_module(ui_legacy)
+        except FileNotFoundError as exc:
+            raise ImportError("Could not find ui.py file") from exc
         sys.modules[module_name] = ui_legacy
-    else:
-        # Module already loaded, get StudentManagerApp from it
-        ui_legacy = sys.modules[module_name]
-        StudentManagerApp = ui_legacy.StudentManagerApp
-else:
-    raise ImportError("Could not find ui.py file")
+    return ui_legacy.StudentManagerApp
+
+
+StudentManagerApp = _load_legacy_ui()
 
 __all__ = [
     "PROJECT_TITLE",
@@ -54,13 +64,42 @@ __all__ = [
 ]
 
 
+def __getattr__(name):
+    """Resolve utils names lazily (PEP 562).
+
+    The import runs once on first use and the results are cached in
+    module globals, so every later access is a plain attribute load
+    instead of re-entering the import machinery per launch_app call.
+    """
+    if name in ("log_action", "PROFILES_DIR"):
+        from utils import log_action, PROFILES_DIR
+        globals()["log_action"] = log_action
+        globals()["PROFILES_DIR"] = PROFILES_DIR
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _warm_utils() -> None:
+    """Import utils and create the app directories off the main thread."""
+    from utils import ensure_directories
+    ensure_directories()
+
+
 def launch_app() -> None:
     """
     Launcher function called from main.py.
     """
-    from utils import log_action, PROFILES_DIR
-    
+    # Overlap the utils import and directory stats/mkdirs with Tk widget
+    # construction; join before logging, which needs both done
+    warm = threading.Thread(target=_warm_utils, daemon=True)
+    warm.start()
+
     app = StudentManagerApp()
+
+    warm.join()
+    # Prime the lazy names: module __getattr__ only fires for attribute
+    # access, not for global lookups inside this module's functions
+    log_action = __getattr__("log_action")
     log_action(f"Application started. Profiles directory: {PROFILES_DIR}")
     app.mainloop()
     log_action("Application closed")
@@ -1116,7 +1116,7 @@ class StudentManagerApp(ctk.CTk):
         """Open the report generation dialog."""
         try:
             from reporting.report_ui import ReportDialog
-            ReportDialog(self)
+            ReportDialog.show(self)
         except ImportError as e:
             messagebox.showerror(
                 "Error",
@@ -1,6 +1,8 @@
 import json
 import logging
+import os
 import shutil
+import stat
 import re
 from datetime import datetime
 from pathlib import Path
@@ -23,6 +25,15 @@ THEMES_DIR = BASE_DIR / "themes"
 # Input Validation and Sanitization Functions
 # ============================================================================
 
+# Compiled once at import: validate_email is called per keystroke/profile,
+# so per-call re.compile (even via the regex cache) is avoidable overhead.
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Maps each filesystem-unsafe character to an underscore; built once so
+# sanitize_filename is a single translate() pass instead of a regex sub
+_FILENAME_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
 def validate_email(email: str) -> bool:
     """
     Validate email format.
@@ -35,8 +46,7 @@ def validate_email(email: str) -> bool:
     """
     if not email or not isinstance(email, str):
         return False
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email.strip()))
+    return bool(_EMAIL_RE.match(email.strip()))
 
 
 def sanitize_filename(filename: str) -> str:
@@ -56,7 +66,7 @@ def sanitize_filename(filename: str) -> str:
     filename = Path(filename).name
     
     # Remove dangerous characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    filename = filename.translate(_FILENAME_TABLE)
     
     # Remove leading/trailing dots and spaces (Windows issue)
     filename = filename.strip('. ')
@@ -171,6 +181,13 @@ def validate_path(path: Path, must_exist: bool = False, must_be_file: bool = Fal
         return False, f"Invalid path: {str(e)}"
 
 
+# Deletion table for control characters (except tab/newline/CR): one C-level
+# translate() pass replaces the regex substitution on every sanitized string
+_CONTROL_CHAR_TABLE = {
+    c: None for c in range(0x20) if c not in (0x09, 0x0A, 0x0D)
+}
+
+
 def sanitize_string(value: Any, max_length: Optional[int] = None) -> str:
     """
     Sanitize string input to prevent injection attacks.
@@ -190,7 +207,7 @@ def sanitize_string(value: Any, max_length: Optional[int] = None) -> str:
         value = str(value)
     
     # Remove null bytes and control characters (except newlines and tabs)
-    value = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F]', '', value)
+    value = value.translate(_CONTROL_CHAR_TABLE)
     
     # Limit length if specified
     if max_length and len(value) > max_length:
@@ -203,6 +220,32 @@ def sanitize_string(value: Any, max_length: Optional[int] = None) -> str:
 # Directory and File Management
 # ============================================================================
 
+# In-memory stat cache for profile paths, positive entries only:
+# save_profile refreshes its entry after writing and delete_profile
+# drops it. Missing paths are deliberately never cached, so a file
+# recreated outside save_profile (synced or restored externally) is
+# picked up on the next lookup instead of staying invisible forever.
+_stat_cache: Dict[str, os.stat_result] = {}
+
+
+def _stat_profile(path: Path) -> Optional[os.stat_result]:
+    """Return the os.stat result for a profile path, or None if missing."""
+    key = str(path)
+    cached = _stat_cache.get(key)
+    if cached is not None:
+        return cached
+    try:
+        result = os.stat(path)
+    except OSError:
+        return None
+    _stat_cache[key] = result
+    return result
+
+
+def cached_exists(path: Path) -> bool:
+    """Check whether a profile path exists, backed by the stat cache."""
+    return _stat_profile(path) is not None
+
 def ensure_directories() -> None:
     """
     Ensure that all required directories exist.
@@ -259,12 +302,14 @@ def load_profile(profile_path: Path) -> Dict[str, Any]:
         json.JSONDecodeError: If profile file contains invalid JSON
         OSError: If file cannot be read
     """
-    if not profile_path.exists():
+    # One stat (cached) answers both the existence and regular-file checks
+    stat_result = _stat_profile(profile_path)
+    if stat_result is None:
         raise FileNotFoundError(f"Profile file not found: {profile_path}")
-    
-    if not profile_path.is_file():
+
+    if not stat.S_ISREG(stat_result.st_mode):
         raise ValueError(f"Profile path is not a file: {profile_path}")
-    
+
     try:
         with profile_path.open("r", encoding="utf-8") as f:
             return json.load(f)
@@ -274,6 +319,10 @@ def load_profile(profile_path: Path) -> Dict[str, Any]:
             e.doc,
             e.pos
         ) from e
+    except FileNotFoundError:
+        # The cached stat was stale: the file vanished outside delete_profile
+        _stat_cache.pop(str(profile_path), None)
+        raise FileNotFoundError(f"Profile file not found: {profile_path}")
     except OSError as e:
         raise OSError(f"Failed to read profile file {profile_path}: {e}") from e
 
@@ -320,6 +369,7 @@ def save_profile(profile_data: Dict[str, Any], filename: Optional[str] = None) -
     
     with profile_path.open("w", encoding="utf-8") as f:
         json.dump(profile_data, f, indent=2, ensure_ascii=False)
+    _stat_cache[str(profile_path)] = os.stat(profile_path)
     log_action(f"Saved profile: {profile_path.name}")
     return profile_path
 
@@ -330,6 +380,7 @@ def delete_profile(profile_path: Path) -> None:
     """
     try:
         profile_path.unlink(missing_ok=True)
+        _stat_cache.pop(str(profile_path), None)
         log_action(f"Deleted profile: {profile_path.name}")
     except OSError as exc:
         logging.error("Error deleting profile %s: %s", profile_path, exc)